@@ -183,10 +183,10 @@ class HTTPServer(Parameterized):
         # print("client pool context", self.zmq_client_pool.context)
         event_loop = EventLoop.get_async_loop() # sets async loop for a non-possessing thread as well
         self.update_router_with_things()
-        event_loop.call_soon(lambda : asyncio.create_task(self.subscribe_to_host()))
-        event_loop.call_soon(lambda : asyncio.create_task(self.zmq_client_pool.poll()) )
+        event_loop.create_task(self.subscribe_to_host())
+        event_loop.create_task(self.zmq_client_pool.poll())
         for client in self.zmq_client_pool:
-            event_loop.call_soon(lambda : asyncio.create_task(client._handshake(timeout=60000)))
+            event_loop.create_task(client._handshake(timeout=60000))
 
         self.tornado_event_loop = None 
         # set value based on what event loop we use, there is some difference 
@@ -264,7 +264,7 @@ class HTTPServer(Parameterized):
         """
         event_loop = EventLoop.get_async_loop() # sets async loop for a non-possessing thread as well
         for client in self.zmq_client_pool:
-            event_loop.call_soon(lambda : asyncio.create_task(self.update_router_with_thing(client)))
+            event_loop.create_task(self.update_router_with_thing(client))
             
 
         
@@ -62,7 +62,29 @@ class Configuration:
     PWD_HASHER_MEMORY_COST - system view server password authentication memory cost. 
     Refer argon2-cffi docs.
 
-    USE_UVLOOP - signicantly faster event loop for Linux systems. Reads data from network faster. default False. 
+    USE_UVLOOP - signicantly faster event loop for Linux systems. Reads data from network faster. Needs the optional 
+    uvloop package, the default asyncio event loop is used with a warning when it is not installed. default False. 
+
+    ZMQ_SNDHWM - high water mark of outgoing messages queued per peer for every IPC & TCP ZMQ socket created by the 
+    package. None leaves the ZeroMQ default of 1000. default None.
+
+    ZMQ_RCVHWM - high water mark of incoming messages queued per peer for every IPC & TCP ZMQ socket created by the 
+    package. None leaves the ZeroMQ default of 1000. default None.
+
+    ZMQ_INPROC_HWM - send & receive high water mark of INPROC sockets, which tunnel every instruction of a ``Thing`` 
+    from its external servers. Messages beyond it are dropped by ROUTER sockets, therefore higher than the ZeroMQ 
+    default. None applies ZMQ_SNDHWM & ZMQ_RCVHWM instead. default 65536.
+
+    ZMQ_LINGER - milliseconds unsent messages are kept after a socket is closed, None leaves the ZeroMQ default. 
+    default None.
+
+    ZMQ_IPC_ABSTRACT_NAMESPACE - on Linux, bind and connect automatically named IPC sockets in the abstract socket 
+    namespace instead of creating socket files under TEMP_DIR. Avoids filesystem lookups and stale socket files, but 
+    all peers must share the network namespace, for example not be in different containers. Ignored on other 
+    platforms. default False.
+
+    ZMQ_IO_THREADS - number of ZeroMQ I/O threads of every context created by a ``Thing`` or ``RPCServer``. All transports 
+    of a ``Thing`` share its context, so raise it only for very high TCP/IPC message rates. default 1.
 
     Parameters
     ----------
@@ -86,6 +108,9 @@ class Configuration:
         "PWD_HASHER_TIME_COST", "PWD_HASHER_MEMORY_COST",
         # Eventloop
         "USE_UVLOOP", "TRACE_MALLOC",
+        # ZMQ sockets
+        "ZMQ_SNDHWM", "ZMQ_RCVHWM", "ZMQ_INPROC_HWM", "ZMQ_LINGER", "ZMQ_IO_THREADS", 
+        "ZMQ_IPC_ABSTRACT_NAMESPACE",
         'validate_schema_on_client', 'validate_schemas'
     ]
 
@@ -104,6 +129,12 @@ class Configuration:
         self.PWD_HASHER_TIME_COST = 15
         self.USE_UVLOOP = False
         self.TRACE_MALLOC = False
+        self.ZMQ_SNDHWM = None
+        self.ZMQ_RCVHWM = None
+        self.ZMQ_INPROC_HWM = 65536
+        self.ZMQ_LINGER = None
+        self.ZMQ_IO_THREADS = 1
+        self.ZMQ_IPC_ABSTRACT_NAMESPACE = False
         self.validate_schema_on_client = False
         self.validate_schemas = True 
 
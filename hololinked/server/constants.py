@@ -128,6 +128,25 @@ class ServerMessage(IntEnum):
     ENCODED_DATA = 6
 
 
+class MessageTypes(IntEnum):
+    """
+    ZMQ message types. Sent on the wire as a single byte, see the byte constants 
+    in ``zmq_message_brokers``
+    """
+    HANDSHAKE = 1
+    INSTRUCTION = 2
+    EXIT = 3
+    REPLY = 4
+    TIMEOUT = 5
+    EXCEPTION = 6
+    INVALID_MESSAGE = 7
+    ONEWAY = 8
+    INTERRUPT = 9
+    EVENT = 10
+    EVENT_SUBSCRIPTION = 11
+    SUCCESS = 12
+
+
 class ServerTypes(Enum):
     "type of ZMQ servers"
 
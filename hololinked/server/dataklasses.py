@@ -3,7 +3,6 @@ The following is a list of all dataclasses used to store information on the expo
 resources on the network. These classese are generally not for consumption by the package-end-user. 
 """
 import typing
-import platform
 import inspect
 from enum import Enum
 from dataclasses import dataclass, asdict, field, fields
@@ -156,6 +155,8 @@ class SerializableDataclass:
     Presents uniform serialization for serializers using getstate and setstate and json 
     serialization.
     """
+    __slots__ = () # allows slotted subclasses to be without instance __dict__ 
+
     def json(self):
         return asdict(self)
 
@@ -167,11 +168,7 @@ class SerializableDataclass:
             setattr(self, key, value)
 
 
-__dataclass_kwargs = dict(frozen=True)
-if float('.'.join(platform.python_version().split('.')[0:2])) >= 3.11:
-    __dataclass_kwargs["slots"] = True
-
-@dataclass(**__dataclass_kwargs)
+@dataclass(frozen=True, slots=True)
 class RemoteResource(SerializableDataclass):
     """
     This container class is used by the ``EventLoop`` methods (for example ``execute_once()``) to access resource 
@@ -219,7 +216,7 @@ class RemoteResource(SerializableDataclass):
         return json_dict     
 
 
-@dataclass(**__dataclass_kwargs)
+@dataclass(frozen=True, slots=True)
 class ActionResource(RemoteResource):  
     """
     Attributes
@@ -6,6 +6,7 @@ import asyncio
 import importlib
 import typing 
 import threading
+import concurrent.futures
 import logging
 import tracemalloc
 from uuid import uuid4
@@ -13,10 +14,11 @@ from uuid import uuid4
 from .constants import HTTP_METHODS
 from .utils import format_exception_as_json
 from .config import global_config
-from .zmq_message_brokers import ServerTypes 
+from .zmq_message_brokers import ServerTypes, ONEWAY, EXCEPTION
 from .exceptions import *
 from .thing import Thing, ThingMeta
 from .property import Property
+from .dataklasses import RemoteResource
 from .properties import ClassSelector, TypedList, List, Boolean, TypedDict
 from .action import action as remote_method
 from .logger import ListHandler
@@ -25,17 +27,23 @@ from .logger import ListHandler
 if global_config.TRACE_MALLOC:
     tracemalloc.start()
 
+try:
+    import uvloop # optional, only used when global_config.USE_UVLOOP is set
+except ImportError:
+    uvloop = None 
+
 
 def set_event_loop_policy():
     if sys.platform.lower().startswith('win'):
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
     if global_config.USE_UVLOOP:
-        if sys.platform.lower() in ['linux', 'darwin', 'linux2']:
-            import uvloop
-            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-        else:
+        if sys.platform.lower() not in ['linux', 'darwin', 'linux2']:
             warnings.warn("uvloop not supported for windows, using default windows selector loop.", RuntimeWarning)
+        elif uvloop is None:
+            warnings.warn("uvloop is not installed, using default asyncio event loop.", RuntimeWarning)
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 set_event_loop_policy()
 
@@ -183,28 +191,59 @@ class EventLoop(RemoteObject):
         instance = consumer(**kwargs, eventloop_name=self.instance_name) # type: Thing
         self.things.append(instance)
         rpc_server = instance.rpc_server
-        self.request_listener_loop.call_soon(asyncio.create_task(lambda : rpc_server.poll()))
-        self.request_listener_loop.call_soon(asyncio.create_task(lambda : rpc_server.tunnel_message_to_things()))
+        # instantiate() executes in a thing executor thread, the listener loop runs in another thread
+        futures = [
+            asyncio.run_coroutine_threadsafe(rpc_server.poll(), self.request_listener_loop),
+            asyncio.run_coroutine_threadsafe(rpc_server.tunnel_message_to_things(), self.request_listener_loop)
+        ]
         if not self.threaded:
-            self.thing_executor_loop.call_soon(asyncio.create_task(lambda : self.run_single_target(instance)))
+            futures.append(asyncio.run_coroutine_threadsafe(self.run_single_target(instance), self.thing_executor_loop))
         else: 
-            _thing_executor = threading.Thread(target=self.run_things_executor, args=([instance],))
-            _thing_executor.start()
+            # the pool cannot grow, but workers of things that already exited are idle and can be reused
+            self._thing_executors = [executor for executor in self._thing_executors if not executor.done()]
+            if len(self._thing_executors) < self._thing_executor_pool_size:
+                thing_executor = self._thing_executor_pool.submit(self.run_things_executor, [instance])
+                self._thing_executors.append(thing_executor)
+                futures.append(thing_executor)
+            else:
+                _thing_executor = threading.Thread(target=self.run_things_executor, args=([instance],))
+                _thing_executor.start()
+                self._thing_executor_threads.append(_thing_executor)
+        for future in futures:
+            future.add_done_callback(self._log_executor_exception)
 
     def run(self):
         """
         start the eventloop
         """
-        if not self.threaded:
-            _thing_executor = threading.Thread(target=self.run_things_executor, args=(self.things,))
-            _thing_executor.start()
-        else: 
-            for thing in self.things:
-                _thing_executor = threading.Thread(target=self.run_things_executor, args=([thing],))
-                _thing_executor.start()
+        # all things share one executor thread, or each thing gets its own when threaded
+        thing_groups = [[thing] for thing in self.things] if self.threaded else [self.things]
+        # every executor runs until its things exit, so the pool needs one worker per group
+        self._thing_executor_pool_size = max(1, len(thing_groups))
+        self._thing_executor_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self._thing_executor_pool_size, 
+                                                    thread_name_prefix='thing-executor')
+        self._thing_executors = [self._thing_executor_pool.submit(self.run_things_executor, things) 
+                            for things in thing_groups] # type: typing.List[concurrent.futures.Future]
+        for thing_executor in self._thing_executors:
+            thing_executor.add_done_callback(self._log_executor_exception)
+        self._thing_executor_threads = [] # type: typing.List[threading.Thread]
         self.run_external_message_listener()
-        if not self.threaded:
-            _thing_executor.join()
+        # the listener stops once all things exited, wait for every executor to finish as well before returning
+        self._thing_executor_pool.shutdown(wait=True)
+        for thing_executor in self._thing_executor_threads:
+            thing_executor.join()
+
+
+    def _log_executor_exception(self, future : concurrent.futures.Future) -> None:
+        """
+        done callback of executor and listener futures, which would otherwise swallow the exception that stopped 
+        a thing
+        """
+        if not future.cancelled() and future.exception() is not None:
+            exception = future.exception()
+            self.logger.error("thing executor or listener of event loop {} stopped with exception : {}".format(
+                                self.instance_name, exception), 
+                                exc_info=(type(exception), exception, exception.__traceback__))
 
 
     @classmethod
@@ -214,11 +253,24 @@ class EventLoop(RemoteObject):
         """
         try:
             loop = asyncio.get_event_loop()
+            if loop.is_closed():
+                raise RuntimeError("event loop of current thread is closed")
         except RuntimeError:
-            loop = asyncio.new_event_loop()
-            # set_event_loop_policy() - why not?
+            loop = cls.new_async_loop()
             asyncio.set_event_loop(loop)
         return loop
+    
+
+    @classmethod
+    def new_async_loop(cls):
+        """
+        create a new async loop, a uvloop if ``global_config.USE_UVLOOP`` is set, uvloop is installed and 
+        supported by the platform. Checked at call time so that enabling uvloop after import is honored as well.
+        """
+        if (global_config.USE_UVLOOP and uvloop is not None and 
+                sys.platform.lower() in ['linux', 'darwin', 'linux2']):
+            return uvloop.new_event_loop()
+        return asyncio.new_event_loop()
         
 
     def run_external_message_listener(self):
@@ -247,12 +299,17 @@ class EventLoop(RemoteObject):
         This method is automatically called by ``run()`` method. 
         Please dont call this method when the async loop is already running. 
         """
-        thing_executor_loop = self.get_async_loop()
+        thing_executor_loop = self.new_async_loop() # executor threads are always fresh, never reuse a loop
+        asyncio.set_event_loop(thing_executor_loop)
         self.thing_executor_loop = thing_executor_loop # atomic assignment for thread safety
         self.logger.info(f"starting thing executor loop in thread {threading.get_ident()} for {[obj.instance_name for obj in things]}")
-        thing_executor_loop.run_until_complete(
-            asyncio.gather(*[self.run_single_target(instance) for instance in things])
-        )
+        if len(things) == 1:
+            # usual case of one thing per executor, no gather future needed
+            thing_executor_loop.run_until_complete(self.run_single_target(things[0]))
+        else:
+            thing_executor_loop.run_until_complete(
+                asyncio.gather(*[self.run_single_target(instance) for instance in things])
+            )
         self.logger.info(f"exiting event loop in thread {threading.get_ident()}")
         thing_executor_loop.close()
 
@@ -264,19 +321,19 @@ class EventLoop(RemoteObject):
             instructions = await instance.message_broker.async_recv_instructions()
             for instruction in instructions:
                 client, _, client_type, _, msg_id, _, instruction_str, arguments, context = instruction
-                oneway = context.pop('oneway', False)
-                fetch_execution_logs = context.pop("fetch_execution_logs", False)
+                oneway = context.oneway
+                fetch_execution_logs = context.fetch_execution_logs
                 if fetch_execution_logs:
                     list_handler = ListHandler([])
                     list_handler.setLevel(logging.DEBUG)
                     list_handler.setFormatter(instance.logger.handlers[0].formatter)
                     instance.logger.addHandler(list_handler)
                 try:
-                    instance.logger.debug(f"client {client} of client type {client_type} issued instruction " +
-                                f"{instruction_str} with message id {msg_id}. starting execution.")
+                    instance.logger.debug("client %s of client type %s issued instruction %s with message id %s. " +
+                                "starting execution.", client, client_type, instruction_str, msg_id)
                     return_value = await cls.execute_once(instance_name, instance, instruction_str, arguments) #type: ignore 
                     if oneway:
-                        await instance.message_broker.async_send_reply_with_message_type(instruction, b'ONEWAY', None)
+                        await instance.message_broker.async_send_reply_with_message_type(instruction, ONEWAY, None)
                         continue
                     if fetch_execution_logs:
                         return_value = {
@@ -289,7 +346,7 @@ class EventLoop(RemoteObject):
                     instance.logger.info("Thing {} with instance name {} exiting event loop.".format(
                                                             instance.__class__.__name__, instance_name))
                     if oneway:
-                        await instance.message_broker.async_send_reply_with_message_type(instruction, b'ONEWAY', None)
+                        await instance.message_broker.async_send_reply_with_message_type(instruction, ONEWAY, None)
                         continue
                     return_value = None
                     if fetch_execution_logs:
@@ -303,13 +360,13 @@ class EventLoop(RemoteObject):
                     instance.logger.error("Thing {} with instance name {} produced error : {}.".format(
                                                             instance.__class__.__name__, instance_name, ex))
                     if oneway:
-                        await instance.message_broker.async_send_reply_with_message_type(instruction, b'ONEWAY', None)
+                        await instance.message_broker.async_send_reply_with_message_type(instruction, ONEWAY, None)
                         continue
                     return_value = dict(exception= format_exception_as_json(ex))
                     if fetch_execution_logs:
                         return_value["execution_logs"] = list_handler.log_list
                     await instance.message_broker.async_send_reply_with_message_type(instruction, 
-                                                                    b'EXCEPTION', return_value)
+                                                                    EXCEPTION, return_value)
                 finally:
                     if fetch_execution_logs:
                         instance.logger.removeHandler(list_handler)
@@ -349,27 +406,42 @@ class EventLoop(RemoteObject):
                         instance_name, instance.state, resource.state))
         
         elif resource.isproperty:
-            action = instruction_str.split('/')[-1]
-            prop = resource.obj # type: Property
-            owner_inst = resource.bound_obj # type: Thing
-            if action == "write": 
-                if resource.state is None or (hasattr(instance, 'state_machine') and  
-                                        instance.state_machine.current_state in resource.state):
-                    if isinstance(arguments, dict) and len(arguments) == 1 and 'value' in arguments:
-                        return prop.__set__(owner_inst, arguments['value'])
-                    return prop.__set__(owner_inst, arguments)
-                else: 
-                    raise StateMachineError("Thing {} is in `{}` state, however attribute can be written only in `{}` state".format(
-                        instance_name, instance.state_machine.current_state, resource.state))
-            elif action == "read":
-                return prop.__get__(owner_inst, type(owner_inst))             
-            elif action == "delete":
-                if prop.fdel is not None:
-                    return prop.fdel() # this may not be correct yet
-                raise NotImplementedError("This property does not support deletion")
+            operation = _property_operations.get(instruction_str.rpartition('/')[2], None)
+            if operation is not None:
+                return operation(instance_name, instance, resource, arguments)
         raise NotImplementedError("Unimplemented execution path for Thing {} for instruction {}".format(instance_name, instruction_str))
 
 
+def _read_property(instance_name : str, instance : Thing, resource : RemoteResource, arguments : typing.Any) -> typing.Any:
+    owner_inst = resource.bound_obj # type: Thing
+    return resource.obj.__get__(owner_inst, type(owner_inst))
+    
+
+def _write_property(instance_name : str, instance : Thing, resource : RemoteResource, arguments : typing.Any) -> None:
+    if resource.state is None or (hasattr(instance, 'state_machine') and  
+                            instance.state_machine.current_state in resource.state):
+        if isinstance(arguments, dict) and len(arguments) == 1 and 'value' in arguments:
+            return resource.obj.__set__(resource.bound_obj, arguments['value'])
+        return resource.obj.__set__(resource.bound_obj, arguments)
+    raise StateMachineError("Thing {} is in `{}` state, however attribute can be written only in `{}` state".format(
+        instance_name, instance.state_machine.current_state, resource.state))
+
+
+def _delete_property(instance_name : str, instance : Thing, resource : RemoteResource, arguments : typing.Any) -> None:
+    prop = resource.obj # type: Property
+    if prop.fdel is not None:
+        return prop.fdel() # this may not be correct yet
+    raise NotImplementedError("This property does not support deletion")
+
+
+# property instructions end with the operation, looked up once instead of comparing against each one in turn
+_property_operations = {
+    'read' : _read_property,
+    'write' : _write_property,
+    'delete' : _delete_property
+}
+
+
 def fork_empty_eventloop(instance_name : str, logfile : typing.Union[str, None] = None, python_command : str = 'python',
                         condaenv : typing.Union[str, None] = None, prefix_command : typing.Union[str, None] = None):
     command_str = '{}{}{}-c "from hololinked.server import EventLoop; E = EventLoop({}); E.run();"'.format(
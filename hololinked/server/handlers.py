@@ -192,9 +192,8 @@ class RPCHandler(BaseHandler):
                 self.set_status(200, "ok")
             except ConnectionAbortedError as ex:
                 self.set_status(503, str(ex))
-                event_loop = asyncio.get_event_loop()
-                event_loop.call_soon(lambda : asyncio.create_task(self.owner.update_router_with_thing(
-                                                                    self.zmq_client_pool[self.resource.instance_name])))
+                asyncio.create_task(self.owner.update_router_with_thing(
+                                                    self.zmq_client_pool[self.resource.instance_name]))
             except ConnectionError as ex:
                 await self.owner.update_router_with_thing(self.zmq_client_pool[self.resource.instance_name])
                 await self.handle_through_thing(http_method) # reschedule
@@ -399,7 +398,7 @@ class StopHandler(BaseHandler):
         else:
             try:
                 # Stop the Tornado server
-                asyncio.get_event_loop().call_soon(lambda : asyncio.create_task(self.owner.stop()))
+                asyncio.create_task(self.owner.stop())
                 self.set_status(204, "ok")
                 self.set_header("Access-Control-Allow-Credentials", "true")
             except Exception as ex:
@@ -134,7 +134,7 @@ class RemoteAccessHandler(logging.Handler, RemoteObject):
         """
         self.stream_interval = stream_interval 
         if scheduling == 'asyncio':
-            asyncio.get_event_loop().call_soon(lambda : asyncio.create_task(self._async_push_diff_logs()))
+            asyncio.get_event_loop().create_task(self._async_push_diff_logs())
         elif scheduling == 'threading':
             if self._events_thread is not None: # dont create again if one is already running
                 self._events_thread = threading.Thread(target=self._push_diff_logs)
@@ -54,6 +54,9 @@ class BaseSerializer(object):
     Serialization and deserialization errors will be passed as invalid message type 
     (see ZMQ messaging contract) from server side and a exception will be raised on the client.  
     """
+    # one serializer instance is used for all messages of a broker, no instance __dict__ needed. 
+    # Subclasses may or may not define slots.
+    __slots__ = ('type',)
 
     def __init__(self) -> None:
         super().__init__()
@@ -82,19 +85,24 @@ dict_keys = type(dict().keys())
 class JSONSerializer(BaseSerializer):
     "(de)serializer that wraps the msgspec JSON serialization protocol, default serializer for all clients."
 
+    __slots__ = ('_encoder', '_decoder')
     _type_replacements = {}
 
     def __init__(self) -> None:
         super().__init__()
         self.type = msgspecjson
+        # reusable encoder & decoder are faster than the module level functions which configure one per call
+        self._encoder = msgspecjson.Encoder(enc_hook=self.default)
+        self._decoder = msgspecjson.Decoder()
 
     def loads(self, data : typing.Union[bytearray, memoryview, bytes]) -> JSONSerializable:
         "method called by ZMQ message brokers to deserialize data"
-        return msgspecjson.decode(self.convert_to_bytes(data))
+        # msgspec decodes any buffer directly, zero-copy frames need not be converted to bytes first
+        return self._decoder.decode(data)
     
     def dumps(self, data) -> bytes:
         "method called by ZMQ message brokers to serialize data"
-        return msgspecjson.encode(data, enc_hook=self.default)
+        return self._encoder.encode(data)
       
     @classmethod
     def default(cls, obj) -> JSONSerializable:
@@ -140,6 +148,7 @@ class JSONSerializer(BaseSerializer):
 
 class PythonBuiltinJSONSerializer(JSONSerializer):
     "(de)serializer that wraps the python builtin JSON serialization protocol."
+    __slots__ = ()
 
     def __init__(self) -> None:
         super().__init__() 
@@ -165,6 +174,7 @@ class PythonBuiltinJSONSerializer(JSONSerializer):
 
 class PickleSerializer(BaseSerializer):
     "(de)serializer that wraps the pickle serialization protocol, use with encryption for safety."
+    __slots__ = ()
 
     def __init__(self) -> None:
         super().__init__() 
@@ -176,7 +186,7 @@ class PickleSerializer(BaseSerializer):
     
     def loads(self, data) -> typing.Any:
         "method called by ZMQ message brokers to deserialize data"
-        return pickle.loads(self.convert_to_bytes(data))
+        return pickle.loads(data) # accepts any bytes-like object
     
 
 
@@ -186,16 +196,19 @@ class MsgpackSerializer(BaseSerializer):
     high speed applications. Set an instance of this serializer to both ``Thing.zmq_serializer`` and 
     ``hololinked.client.ObjectProxy``. Unfortunately, MessagePack is currently not supported for HTTP clients. 
     """
+    __slots__ = ('_encoder', '_decoder')
 
     def __init__(self) -> None:
         super().__init__()
         self.type = msgpack
+        self._encoder = msgpack.Encoder()
+        self._decoder = msgpack.Decoder()
 
     def dumps(self, value) -> bytes:
-        return msgpack.encode(value)
+        return self._encoder.encode(value)
 
     def loads(self, value) -> typing.Any:
-        return msgpack.decode(self.convert_to_bytes(value))
+        return self._decoder.decode(value)
     
 serializers = {
     None      : JSONSerializer,
@@ -210,6 +223,7 @@ try:
 
     class SerpentSerializer(BaseSerializer):
         """(de)serializer that wraps the serpent serialization protocol."""
+        __slots__ = ()
 
         def __init__(self) -> None:
             super().__init__()
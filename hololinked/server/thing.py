@@ -19,6 +19,7 @@ from .utils import get_default_logger, getattr_without_descriptor_read
 from .property import Property, ClassProperties
 from .properties import String, ClassSelector, Selector, TypedKeyMappingsConstrainedDict
 from .zmq_message_brokers import RPCServer, ServerTypes, EventPublisher
+from .config import global_config
 from .state_machine import StateMachine
 from .events import Event
 
@@ -542,7 +543,7 @@ class Thing(Parameterized, metaclass=ThingMeta):
         context = kwargs.get('context', None)
         if context is not None and not isinstance(context, zmq.asyncio.Context):
             raise TypeError("context must be an instance of zmq.asyncio.Context")
-        context = context or zmq.asyncio.Context()
+        context = context or zmq.asyncio.Context(io_threads=global_config.ZMQ_IO_THREADS)
 
         self.rpc_server = RPCServer(
                                 instance_name=self.instance_name, 
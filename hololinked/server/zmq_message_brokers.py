@@ -1,5 +1,7 @@
 import builtins
 import os
+import operator
+import sys
 import threading
 import time
 import warnings
@@ -11,30 +13,31 @@ import typing
 from uuid import uuid4
 from collections import deque
 from enum import Enum
+from msgspec import msgpack, Struct
 from zmq.utils.monitor import parse_monitor_message
 
 from .utils import *
 from .config import global_config
-from .constants import JSON, ZMQ_PROTOCOLS, CommonRPC, ServerTypes, ZMQSocketType, ZMQ_EVENT_MAP
+from .constants import JSON, ZMQ_PROTOCOLS, CommonRPC, MessageTypes, ServerTypes, ZMQSocketType, ZMQ_EVENT_MAP
 from .serializers import BaseSerializer, JSONSerializer, _get_serializer_from_user_given_options
 
 
 
-# message types
-HANDSHAKE   = b'HANDSHAKE'
-INVALID_MESSAGE = b'INVALID_MESSAGE'
-TIMEOUT = b'TIMEOUT'
-INSTRUCTION = b'INSTRUCTION'
-REPLY       = b'REPLY'
-EXCEPTION   = b'EXCEPTION'
-INTERRUPT   = b'INTERRUPT'
-ONEWAY      = b'ONEWAY'
+# message types - a single byte on the wire
+HANDSHAKE   = bytes([MessageTypes.HANDSHAKE])
+INVALID_MESSAGE = bytes([MessageTypes.INVALID_MESSAGE])
+TIMEOUT = bytes([MessageTypes.TIMEOUT])
+INSTRUCTION = bytes([MessageTypes.INSTRUCTION])
+REPLY       = bytes([MessageTypes.REPLY])
+EXCEPTION   = bytes([MessageTypes.EXCEPTION])
+INTERRUPT   = bytes([MessageTypes.INTERRUPT])
+ONEWAY      = bytes([MessageTypes.ONEWAY])
 SERVER_DISCONNECTED = 'EVENT_DISCONNECTED'
-EXIT = b'EXIT'
+EXIT = bytes([MessageTypes.EXIT])
 
-EVENT       = b'EVENT'
-EVENT_SUBSCRIPTION = b'EVENT_SUBSCRIPTION'
-SUCCESS     = b'SUCCESS'
+EVENT       = bytes([MessageTypes.EVENT])
+EVENT_SUBSCRIPTION = bytes([MessageTypes.EVENT_SUBSCRIPTION])
+SUCCESS     = bytes([MessageTypes.SUCCESS])
 
 # empty data
 EMPTY_BYTE  = b''
@@ -53,8 +56,8 @@ client's message to server: |br|
 [address, bytes(), client type, message type, message id, timeout, instruction, arguments, execution_context] |br|
 [ 0     ,   1    ,     2      ,      3      ,   4   ,   5        ,    6       ,     7    ,        8         ] |br|
 
-[address, bytes(), server_type, message_type, message id, data]|br|
-[   0   ,   1    ,    2       ,      3      ,      4    ,  5  ]|br|
+[address, bytes(), server_type, message_type, message id, data, encoded_data]|br|
+[   0   ,   1    ,    2       ,      3      ,      4    ,  5  ,       6     ]|br|
 """
 # CM = Client Message
 CM_INDEX_ADDRESS = 0
@@ -72,11 +75,72 @@ SM_INDEX_SERVER_TYPE = 2
 SM_INDEX_MESSAGE_TYPE = 3
 SM_INDEX_MESSAGE_ID = 4
 SM_INDEX_DATA = 5
+SM_INDEX_ENCODED_DATA = 6
 
 # Server types - currently useless metadata
 
 byte_types = (bytes, bytearray, memoryview)
 
+# timeout & execution context are small metadata frames sent with every instruction, they are always 
+# serialized with msgpack irrespective of the client type, only instruction & arguments follow the client's serializer
+_context_encoder = msgpack.Encoder()
+
+
+class ExecutionContext(Struct, frozen=True):
+    """
+    execution context of an instruction as decoded by the server, clients send a plain dictionary with 
+    (a subset of) the same keys. Unknown keys are ignored. 
+
+    Attributes
+    ----------
+    oneway: bool
+        does not reply to client after executing the instruction 
+    fetch_execution_logs: bool
+        fetches logs that were accumulated while execution
+    """
+    oneway : bool = False
+    fetch_execution_logs : bool = False
+
+
+_timeout_decoder = msgpack.Decoder(typing.Optional[float])
+# not strict, so that truthy values like 1 or 'true' given through HTTP query parameters are still accepted as bool
+_execution_context_decoder = msgpack.Decoder(ExecutionContext, strict=False)
+# defaults which are sent with majority of the instructions, encoded once at import  
+_EMPTY_DICT_BYTES = _context_encoder.encode(EMPTY_DICT)
+_NO_TIMEOUT_BYTES = _context_encoder.encode(None)
+_DEFAULT_EXECUTION_CONTEXT = ExecutionContext() # frozen, hence shared by all messages with default context
+# message id, timeout, instruction, arguments & execution context of messages without content like HANDSHAKE & EXIT
+_EMPTY_MESSAGE_TAIL = (EMPTY_BYTE,) * 5
+
+
+# message ids are sliced out of a larger block of random bytes, which amortizes the cost of os.urandom over  
+# many messages. deque.popleft() is atomic, so clients in different threads never receive the same id.
+_message_ids = deque() # type: deque[bytes]
+if hasattr(os, 'register_at_fork'): # unix only, there is no fork on windows
+    os.register_at_fork(after_in_child=_message_ids.clear) # forked processes must not reuse the ids of the parent
+
+def _new_message_id() -> bytes:
+    try:
+        return _message_ids.popleft()
+    except IndexError:
+        block = os.urandom(4096)
+        _message_ids.extend([block[i:i+16] for i in range(16, 4096, 16)])
+        return block[:16]
+
+
+def _validate_poll_timeout(value : typing.Any) -> int:
+    """
+    validates a poll timeout in milliseconds and returns it as int. Integer types of numpy & co. are accepted 
+    through ``operator.index()``, floats and bool are not.
+    """
+    try:
+        timeout = operator.index(value) if not isinstance(value, bool) else -1
+    except TypeError:
+        timeout = -1
+    if timeout < 0:
+        raise ValueError(f"polling period must be a non-negative integer, not {value!r}. Value is considered in milliseconds.")
+    return timeout
+
 
 # Function to get the socket type name from the enum
 def get_socket_type_name(socket_type):
@@ -163,21 +227,37 @@ class BaseZMQ:
         self.identity = identity
         self.socket = self.context.socket(socket_type)
         self.socket.setsockopt_string(zmq.IDENTITY, identity)
+        # queue limits apply only to connections made after setting them, therefore set before bind/connect
+        sndhwm, rcvhwm = global_config.ZMQ_SNDHWM, global_config.ZMQ_RCVHWM
+        if protocol == ZMQ_PROTOCOLS.INPROC and global_config.ZMQ_INPROC_HWM is not None:
+            # instructions are tunneled over inproc, raise the limit only there 
+            sndhwm = rcvhwm = global_config.ZMQ_INPROC_HWM
+        if sndhwm is not None:
+            self.socket.setsockopt(zmq.SNDHWM, sndhwm)
+        if rcvhwm is not None:
+            self.socket.setsockopt(zmq.RCVHWM, rcvhwm)
+        if global_config.ZMQ_LINGER is not None:
+            self.socket.setsockopt(zmq.LINGER, global_config.ZMQ_LINGER)
         socket_address = kwargs.get('socket_address', None)
-        if protocol == ZMQ_PROTOCOLS.IPC or protocol == "IPC":
+        # ZMQ_PROTOCOLS is a StrEnum, so one comparison matches both enum members and plain strings
+        if protocol == ZMQ_PROTOCOLS.IPC:
             if socket_address is None:
                 split_instance_name = self.instance_name.split('/')
                 socket_dir = os.sep  + os.sep.join(split_instance_name[:-1]) if len(split_instance_name) > 1 else ''
                 directory = global_config.TEMP_DIR + socket_dir
-                if not os.path.exists(directory):
-                    os.makedirs(directory)
-                # re-compute for IPC because it looks for a file in a directory
-                socket_address = "ipc://{}{}{}.ipc".format(directory, os.sep, split_instance_name[-1])
+                if global_config.ZMQ_IPC_ABSTRACT_NAMESPACE and sys.platform.startswith('linux'):
+                    # same name in the abstract namespace, which has no file to create, resolve or leave behind
+                    socket_address = "ipc://@{}{}{}.ipc".format(directory, os.sep, split_instance_name[-1])
+                else:
+                    if not os.path.exists(directory):
+                        os.makedirs(directory)
+                    # re-compute for IPC because it looks for a file in a directory
+                    socket_address = "ipc://{}{}{}.ipc".format(directory, os.sep, split_instance_name[-1])
             if bind:
                 self.socket.bind(socket_address)
             else:
                 self.socket.connect(socket_address)
-        elif protocol == ZMQ_PROTOCOLS.TCP or protocol == "TCP":
+        elif protocol == ZMQ_PROTOCOLS.TCP:
             if bind:
                 if not socket_address:
                     for i in range(global_config.TCP_SOCKET_SEARCH_START_PORT, global_config.TCP_SOCKET_SEARCH_END_PORT):
@@ -194,7 +274,7 @@ class BaseZMQ:
                 self.socket.connect(socket_address)
             else:
                 raise RuntimeError(f"Socket address not supplied for TCP connection to identity - {identity}")
-        elif protocol == ZMQ_PROTOCOLS.INPROC or protocol == "INPROC":
+        elif protocol == ZMQ_PROTOCOLS.INPROC:
             # inproc_instance_name = instance_name.replace('/', '_').replace('-', '_')
             if socket_address is None:
                 socket_address = f'inproc://{self.instance_name}'
@@ -230,6 +310,9 @@ class BaseAsyncZMQ(BaseZMQ):
         context = context or zmq.asyncio.Context()
         super().create_socket(identity=identity, bind=bind, context=context, protocol=protocol, 
                             socket_type=socket_type, **kwargs)
+        # synchronous view of the same socket, used to drain already queued messages with NOBLOCK 
+        # without allocating and awaiting a future per message
+        self._sync_socket = zmq.Socket.shadow(self.socket.underlying)
         
 
 class BaseSyncZMQ(BaseZMQ):
@@ -288,6 +371,11 @@ class BaseZMQServer(BaseZMQ):
                                                             zmq_serializer=zmq_serializer,
                                                             http_serializer=http_serializer
                                                         )
+        # serializer to use for a client is looked up by the client type in every message
+        self._serializers = {
+            HTTP_SERVER : self.http_serializer,
+            PROXY : self.zmq_serializer
+        } # type: typing.Dict[bytes, BaseSerializer]
         self.instance_name = instance_name 
         self.server_type = server_type if isinstance(server_type, bytes) else bytes(server_type, encoding='utf-8') 
         self.logger = logger
@@ -295,8 +383,8 @@ class BaseZMQServer(BaseZMQ):
 
     def parse_client_message(self, message : typing.List[bytes]) -> typing.List[typing.Union[bytes, typing.Any]]:
         """
-        deserializes important parts of the client's message, namely instruction, arguments, execution context 
-        based on the client type. For handshake messages, automatically handles handshake. In case of exceptions while 
+        deserializes important parts of the client's message, namely instruction & arguments based on the client type, 
+        and execution context which is always msgpack encoded. For handshake messages, automatically handles handshake. In case of exceptions while 
         deserializing, automatically sends an invalid message to client informing the nature of exception with the 
         exception metadata. 
         
@@ -320,21 +408,21 @@ class BaseZMQServer(BaseZMQ):
         Returns
         -------
         message: List[bytes | Any]
-            message with instruction, arguments and execution context deserialized
+            message with instruction, arguments and execution context (as ``ExecutionContext``) deserialized
 
         """
         try:
             message_type = message[CM_INDEX_MESSAGE_TYPE]
             if message_type == INSTRUCTION:
-                client_type = message[CM_INDEX_CLIENT_TYPE]
-                if client_type == PROXY:
-                    message[CM_INDEX_INSTRUCTION] = self.zmq_serializer.loads(message[CM_INDEX_INSTRUCTION]) # type: ignore
-                    message[CM_INDEX_ARGUMENTS] = self.zmq_serializer.loads(message[CM_INDEX_ARGUMENTS]) # type: ignore
-                    message[CM_INDEX_EXECUTION_CONTEXT] = self.zmq_serializer.loads(message[CM_INDEX_EXECUTION_CONTEXT]) # type: ignore
-                elif client_type == HTTP_SERVER:
-                    message[CM_INDEX_INSTRUCTION] = self.http_serializer.loads(message[CM_INDEX_INSTRUCTION]) # type: ignore
-                    message[CM_INDEX_ARGUMENTS] = self.http_serializer.loads(message[CM_INDEX_ARGUMENTS]) # type: ignore
-                    message[CM_INDEX_EXECUTION_CONTEXT] = self.http_serializer.loads(message[CM_INDEX_EXECUTION_CONTEXT]) # type: ignore
+                serializer = self._serializers.get(message[CM_INDEX_CLIENT_TYPE], None)
+                if serializer is not None:
+                    message[CM_INDEX_INSTRUCTION] = serializer.loads(message[CM_INDEX_INSTRUCTION]) # type: ignore
+                    message[CM_INDEX_ARGUMENTS] = serializer.loads(message[CM_INDEX_ARGUMENTS]) # type: ignore
+                context = message[CM_INDEX_EXECUTION_CONTEXT]
+                if context == _EMPTY_DICT_BYTES:
+                    message[CM_INDEX_EXECUTION_CONTEXT] = _DEFAULT_EXECUTION_CONTEXT # type: ignore
+                else:
+                    message[CM_INDEX_EXECUTION_CONTEXT] = _execution_context_decoder.decode(context) # type: ignore
                 return message 
             elif message_type == HANDSHAKE:
                 self.handshake(message)
@@ -350,29 +438,34 @@ class BaseZMQServer(BaseZMQ):
 
         server's message to client:
         ::
-            [address, bytes(), server_type, message_type, message id, data]
-            [   0   ,   1    ,    2       ,      3      ,  4        ,  5  ]
+            [address, bytes(), server_type, message_type, message id, data, encoded_data]
+            [   0   ,   1    ,    2       ,      3      ,  4        ,  5  ,       6     ]
 
         Parameters
         ----------
         address: bytes 
             the ROUTER address of the client
         message_type: bytes 
-            type of the message, possible values are b'REPLY', b'HANDSHAKE' and b'TIMEOUT' 
+            type of the message, possible values are REPLY, HANDSHAKE and TIMEOUT 
         message_id: bytes
             message id of the original client message for which the reply is being crafted
         data: Any
             serializable data
+        pre_encoded_data: bytes
+            data already serialized (or encoded otherwise) by the caller, sent as it is. When given and data is None, 
+            the data field is left empty instead of serializing None.
         
         Returns
         -------
         message: List[bytes]
             the crafted reply with information in the correct positions within the list
         """
-        if client_type == HTTP_SERVER:
-            data = self.http_serializer.dumps(data)
-        elif client_type == PROXY:
-            data = self.zmq_serializer.dumps(data)
+        if data is None and pre_encoded_data:
+            data = EMPTY_BYTE
+        else:
+            serializer = self._serializers.get(client_type, None)
+            if serializer is not None:
+                data = serializer.dumps(data)
 
         return [
             address,
@@ -393,8 +486,8 @@ class BaseZMQServer(BaseZMQ):
 
         server's message to client:
         ::
-            [address, bytes(), server_type, message_type, message id, data]
-            [   0   ,   1    ,    2       ,      3      ,      4    ,  5  ]
+            [address, bytes(), server_type, message_type, message id, data, encoded_data]
+            [   0   ,   1    ,    2       ,      3      ,      4    ,  5  ,       6     ]
 
         Parameters
         ----------
@@ -402,6 +495,9 @@ class BaseZMQServer(BaseZMQ):
             The message originated by the clieht for which the reply is being crafted
         data: Any
             serializable data 
+        pre_encoded_data: bytes
+            data already serialized (or encoded otherwise) by the caller, sent as it is. When given and data is None, 
+            the data field is left empty instead of serializing None.
 
         Returns
         -------
@@ -409,11 +505,8 @@ class BaseZMQServer(BaseZMQ):
             the crafted reply with information in the correct positions within the list
         """
         client_type = original_client_message[CM_INDEX_CLIENT_TYPE]
-        if client_type == HTTP_SERVER:
-            data = self.http_serializer.dumps(data)
-        elif client_type == PROXY:
-            data = self.zmq_serializer.dumps(data)
-        else:
+        serializer = self._serializers.get(client_type, None)
+        if serializer is None:
             raise ValueError(f"invalid client type given '{client_type}' for preparing message to send from " +
                             f"'{self.identity}' of type {self.__class__}.")
         return [
@@ -422,7 +515,7 @@ class BaseZMQServer(BaseZMQ):
             self.server_type,
             REPLY,
             original_client_message[CM_INDEX_MESSAGE_ID],
-            data,
+            EMPTY_BYTE if data is None and pre_encoded_data else serializer.dumps(data),
             pre_encoded_data
         ]
     
@@ -503,7 +596,7 @@ class BaseAsyncZMQServer(BaseZMQServer):
         """
         await self.socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
                 original_client_message[CM_INDEX_CLIENT_TYPE], HANDSHAKE, original_client_message[CM_INDEX_MESSAGE_ID],
-                EMPTY_BYTE))
+                EMPTY_BYTE), copy=False)
         self.logger.info(f"sent handshake to client '{original_client_message[CM_INDEX_ADDRESS]}'")
 
 
@@ -512,7 +605,7 @@ class BaseAsyncZMQServer(BaseZMQServer):
         Inner method that handles timeout. scheduled by ``handle_timeout()``, signature same as ``handle_timeout``.
         """
         await self.socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
-                original_client_message[CM_INDEX_CLIENT_TYPE], TIMEOUT, original_client_message[CM_INDEX_MESSAGE_ID]))
+                original_client_message[CM_INDEX_CLIENT_TYPE], TIMEOUT, original_client_message[CM_INDEX_MESSAGE_ID]), copy=False)
         self.logger.info(f"sent timeout to client '{original_client_message[CM_INDEX_ADDRESS]}'")
 
     
@@ -523,7 +616,8 @@ class BaseAsyncZMQServer(BaseZMQServer):
         """
         await self.socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
                                             original_client_message[CM_INDEX_CLIENT_TYPE], INVALID_MESSAGE, 
-                                            original_client_message[CM_INDEX_MESSAGE_ID]), exception)         
+                                            original_client_message[CM_INDEX_MESSAGE_ID], 
+                                            dict(exception=format_exception_as_json(exception))), copy=False)
         self.logger.info(f"sent exception message to client '{original_client_message[CM_INDEX_ADDRESS]}'." +
                             f" exception - {str(exception)}") 	
 
@@ -556,7 +650,7 @@ class AsyncZMQServer(BaseAsyncZMQServer, BaseAsyncZMQ):
         while True:
             instruction = self.parse_client_message(await self.socket.recv_multipart())
             if instruction:
-                self.logger.debug(f"received instruction from client '{instruction[CM_INDEX_ADDRESS]}' with msg-ID {instruction[CM_INDEX_MESSAGE_ID]}")
+                self.logger.debug("received instruction from client '%s' with msg-ID %s", instruction[CM_INDEX_ADDRESS], instruction[CM_INDEX_MESSAGE_ID])
                 return instruction
         
 
@@ -571,18 +665,20 @@ class AsyncZMQServer(BaseAsyncZMQServer, BaseAsyncZMQ):
             list of received instructions with important content (instruction, arguments, execution context) deserialized.
         """
         instructions = [await self.async_recv_instruction()]
+        sync_socket = self._sync_socket
         while True:
             try:
-                instruction = self.parse_client_message(await self.socket.recv_multipart(zmq.NOBLOCK))
+                instruction = self.parse_client_message(sync_socket.recv_multipart(zmq.NOBLOCK))
                 if instruction:
-                    self.logger.debug(f"received instruction from client '{instruction[CM_INDEX_ADDRESS]}' with msg-ID {instruction[CM_INDEX_MESSAGE_ID]}")
+                    self.logger.debug("received instruction from client '%s' with msg-ID %s", instruction[CM_INDEX_ADDRESS], instruction[CM_INDEX_MESSAGE_ID])
                     instructions.append(instruction)
             except zmq.Again: 
                 break 
         return instructions
     
 
-    async def async_send_reply(self, original_client_message : typing.List[bytes], data : typing.Any) -> None:
+    async def async_send_reply(self, original_client_message : typing.List[bytes], data : typing.Any, 
+                            pre_encoded_data : bytes = EMPTY_BYTE) -> None:
         """
         Send reply for an instruction. 
 
@@ -592,13 +688,17 @@ class AsyncZMQServer(BaseAsyncZMQServer, BaseAsyncZMQ):
             original message so that the reply can be properly crafted and routed
         data: Any
             serializable data to be sent as reply
+        pre_encoded_data: bytes
+            already encoded data to be sent as it is, ``data`` can be None in this case
 
         Returns
         -------
         None
         """
-        await self.socket.send_multipart(self.craft_reply_from_client_message(original_client_message, data))
-        self.logger.debug(f"sent reply to client '{original_client_message[CM_INDEX_ADDRESS]}' with msg-ID {original_client_message[CM_INDEX_MESSAGE_ID]}")
+        # large serialized or pre-encoded replies are not copied by pyzmq, small ones are anyway copied
+        await self.socket.send_multipart(self.craft_reply_from_client_message(original_client_message, data, 
+                                                                                pre_encoded_data), copy=False)
+        self.logger.debug("sent reply to client '%s' with msg-ID %s", original_client_message[CM_INDEX_ADDRESS], original_client_message[CM_INDEX_MESSAGE_ID])
         
     
     async def async_send_reply_with_message_type(self, original_client_message : typing.List[bytes], 
@@ -619,8 +719,8 @@ class AsyncZMQServer(BaseAsyncZMQServer, BaseAsyncZMQ):
         """
         await self.socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
                                                         original_client_message[CM_INDEX_CLIENT_TYPE], message_type, 
-                                                        original_client_message[CM_INDEX_MESSAGE_ID], data))
-        self.logger.debug(f"sent reply to client '{original_client_message[CM_INDEX_ADDRESS]}' with msg-ID {original_client_message[CM_INDEX_MESSAGE_ID]}")
+                                                        original_client_message[CM_INDEX_MESSAGE_ID], data), copy=False)
+        self.logger.debug("sent reply to client '%s' with msg-ID %s", original_client_message[CM_INDEX_ADDRESS], original_client_message[CM_INDEX_MESSAGE_ID])
         
 
     def exit(self) -> None:
@@ -685,15 +785,15 @@ class AsyncPollingZMQServer(AsyncZMQServer):
     @property
     def poll_timeout(self) -> int:
         """
-        socket polling timeout in milliseconds greater than 0. 
+        socket polling timeout in milliseconds, 0 or greater. 
         """
         return self._poll_timeout
 
     @poll_timeout.setter
     def poll_timeout(self, value) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError(f"polling period must be an integer greater than 0, not {value}. Value is considered in milliseconds.")
-        self._poll_timeout = value 
+        self._poll_timeout = timeout = _validate_poll_timeout(value)
+        # non-blocking polls read the own socket directly instead of going through the poller
+        self._nonblocking_poll = timeout == 0
 
     async def poll_instructions(self) -> typing.List[typing.List[bytes]]:
         """
@@ -708,21 +808,31 @@ class AsyncPollingZMQServer(AsyncZMQServer):
         self.stop_poll = False
         instructions = []
         while not self.stop_poll:
-            sockets = await self.poller.poll(self._poll_timeout) # type hints dont work in this line
-            for socket, _ in sockets:
-                while True:
-                    try:
-                        instruction = self.parse_client_message(await socket.recv_multipart(zmq.NOBLOCK))
-                    except zmq.Again:
-                        break
-                    else:
-                        if instruction:
-                            self.logger.debug(f"received instruction from client '{instruction[CM_INDEX_ADDRESS]}' with msg-ID {instruction[CM_INDEX_MESSAGE_ID]}")
-                            instructions.append(instruction)
+            # non-blocking polls drain the own socket directly, otherwise only when the poller reports the own socket, 
+            # which is the only one registered
+            if self._nonblocking_poll or await self.poller.poll(self._poll_timeout):
+                self._drain_socket(instructions)
             if len(instructions) > 0:
                 break
+            if self._nonblocking_poll:
+                await asyncio.sleep(0) # let other tasks run, like the one that stops polling
         return instructions
 
+    def _drain_socket(self, instructions : typing.List[typing.List[bytes]]) -> None:
+        """
+        receive all instructions currently available on the own socket without blocking and append them to
+        ``instructions``.
+        """
+        while True:
+            try:
+                instruction = self.parse_client_message(self._sync_socket.recv_multipart(zmq.NOBLOCK))
+            except zmq.Again:
+                break
+            else:
+                if instruction:
+                    self.logger.debug("received instruction from client '%s' with msg-ID %s", instruction[CM_INDEX_ADDRESS], instruction[CM_INDEX_MESSAGE_ID])
+                    instructions.append(instruction)
+
     def stop_polling(self) -> None:
         """
         stop polling and unblock ``poll_instructions()`` method
@@ -751,12 +861,14 @@ class ZMQServerPool(BaseZMQServer):
         self.context = zmq.asyncio.Context()
         self.poller = zmq.asyncio.Poller()
         self.pool = dict() # type: typing.Dict[str, typing.Union[AsyncZMQServer, AsyncPollingZMQServer]]
+        self._sync_sockets = dict() # type: typing.Dict[zmq.asyncio.Socket, zmq.Socket]
         if instance_names:
             for instance_name in instance_names:
                 self.pool[instance_name] = AsyncZMQServer(instance_name=instance_name, 
                                     server_type=ServerTypes.UNKNOWN_TYPE.value, context=self.context, **kwargs)
             for server in self.pool.values():
                 self.poller.register(server.socket, zmq.POLLIN)
+                self._sync_sockets[server.socket] = server._sync_socket
         super().__init__(instance_name="pool", server_type=ServerTypes.POOL.value, **kwargs)
         self.identity = "pool"
         if self.logger is None:
@@ -775,23 +887,23 @@ class ZMQServerPool(BaseZMQServer):
                            f" Given type {type(server)}")
         self.pool[server.instance_name] = server 
         self.poller.register(server.socket, zmq.POLLIN)
+        self._sync_sockets[server.socket] = server._sync_socket
 
     def deregister_server(self, server : typing.Union[AsyncZMQServer, AsyncPollingZMQServer]) -> None:
         self.poller.unregister(server.socket)
+        self._sync_sockets.pop(server.socket, None)
         self.pool.pop(server.instance_name)
 
     @property
     def poll_timeout(self) -> int:
         """
-        socket polling timeout in milliseconds greater than 0. 
+        socket polling timeout in milliseconds, 0 or greater. 
         """
         return self._poll_timeout
 
     @poll_timeout.setter
     def poll_timeout(self, value) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError("polling period must be an integer greater than 0, not {}. Value is considered in milliseconds.".format(value))
-        self._poll_timeout = value 
+        self._poll_timeout = _validate_poll_timeout(value)
 
     async def async_recv_instruction(self, instance_name : str) -> typing.List:
         """
@@ -841,14 +953,15 @@ class ZMQServerPool(BaseZMQServer):
         while not self.stop_poll:
             sockets = await self.poller.poll(self._poll_timeout) 
             for socket, _ in sockets:
+                sync_socket = self._sync_sockets[socket]
                 while True:
                     try:
-                        instruction = self.parse_client_message(await socket.recv_multipart(zmq.NOBLOCK))
+                        instruction = self.parse_client_message(sync_socket.recv_multipart(zmq.NOBLOCK))
                     except zmq.Again:
                         break
                     else:
                         if instruction:
-                            self.logger.debug(f"received instruction from client '{instruction[CM_INDEX_ADDRESS]}' with msg-ID {instruction[CM_INDEX_MESSAGE_ID]}")
+                            self.logger.debug("received instruction from client '%s' with msg-ID %s", instruction[CM_INDEX_ADDRESS], instruction[CM_INDEX_MESSAGE_ID])
                             instructions.append(instruction)
         return instructions
         
@@ -912,12 +1025,14 @@ class RPCServer(BaseZMQServer):
         super().__init__(instance_name=instance_name, server_type=server_type, **kwargs)
         
         self.identity = f"{instance_name}/rpc-server"
-        if isinstance(protocols, list): 
+        if isinstance(protocols, (list, tuple)): 
             protocols = protocols 
         elif isinstance(protocols, str): 
             protocols = [protocols]
         else:
             raise TypeError(f"unsupported protocols type : {type(protocols)}")
+        # ZMQ_PROTOCOLS members are plain strings, so enum members and strings normalise to the same names
+        protocols = frozenset(str(protocol).upper() for protocol in protocols)
         tcp_socket_address = kwargs.pop('tcp_socket_address', None)
         kwargs["http_serializer"] = self.http_serializer
         kwargs["zmq_serializer"] = self.zmq_serializer
@@ -927,26 +1042,27 @@ class RPCServer(BaseZMQServer):
             self.logger =  get_default_logger('{}|{}|{}|{}'.format(self.__class__.__name__, 
                                                 'RPC', 'MIXED', instance_name), kwargs.get('log_level', logging.INFO))
         # contexts and poller
-        self.context = context or zmq.asyncio.Context()
+        self.context = context or zmq.asyncio.Context(io_threads=global_config.ZMQ_IO_THREADS)
         self.poller = zmq.asyncio.Poller()
         self.poll_timeout = poll_timeout
         # initialise every externally visible protocol
-        if ZMQ_PROTOCOLS.TCP in protocols or "TCP" in protocols:
+        if ZMQ_PROTOCOLS.TCP in protocols:
             self.tcp_server = AsyncPollingZMQServer(instance_name=instance_name, server_type=server_type, 
                                     context=self.context, protocol=ZMQ_PROTOCOLS.TCP, poll_timeout=poll_timeout, 
                                     socket_address=tcp_socket_address, **kwargs)
-            self.poller.register(self.tcp_server.socket, zmq.POLLIN)
             event_publisher_protocol = ZMQ_PROTOCOLS.TCP
-        if ZMQ_PROTOCOLS.IPC in protocols or "IPC" in protocols: 
+        if ZMQ_PROTOCOLS.IPC in protocols: 
             self.ipc_server = AsyncPollingZMQServer(instance_name=instance_name, server_type=server_type, 
                                     context=self.context, protocol=ZMQ_PROTOCOLS.IPC, poll_timeout=poll_timeout, **kwargs)
-            self.poller.register(self.ipc_server.socket, zmq.POLLIN)
-            event_publisher_protocol = ZMQ_PROTOCOLS.IPC if not event_publisher_protocol else event_publisher_protocol              
-        if ZMQ_PROTOCOLS.INPROC in protocols or "INPROC" in protocols: 
+            event_publisher_protocol = event_publisher_protocol or ZMQ_PROTOCOLS.IPC
+        if ZMQ_PROTOCOLS.INPROC in protocols: 
             self.inproc_server = AsyncPollingZMQServer(instance_name=instance_name, server_type=server_type, 
                                     context=self.context, protocol=ZMQ_PROTOCOLS.INPROC, poll_timeout=poll_timeout, **kwargs)
-            self.poller.register(self.inproc_server.socket, zmq.POLLIN)
-            event_publisher_protocol = ZMQ_PROTOCOLS.INPROC if not event_publisher_protocol else event_publisher_protocol    
+            event_publisher_protocol = event_publisher_protocol or ZMQ_PROTOCOLS.INPROC
+        self._servers = [server for server in (self.inproc_server, self.ipc_server, self.tcp_server) 
+                            if server is not None] # type: typing.List[AsyncPollingZMQServer]
+        for server in self._servers:
+            self.poller.register(server.socket, zmq.POLLIN)
         self.event_publisher = EventPublisher(
                             instance_name=instance_name + '-event-pub',
                             protocol=event_publisher_protocol,
@@ -971,8 +1087,33 @@ class RPCServer(BaseZMQServer):
                                         protocol=ZMQ_PROTOCOLS.INPROC, 
                                         **kwargs
                                     )       
-        self._instructions = deque() # type: deque[typing.Tuple[typing.List[bytes], asyncio.Event, asyncio.Future, zmq.Socket]]
-        self._instructions_event = asyncio.Event()
+        # clients that unblock the receive loop of each external server with an EXIT message once the tunneler stopped. 
+        # They are created once on a synchronous view of the same context, so stopping needs neither a new thread, 
+        # event loop nor context.
+        self._killer_clients = [] # type: typing.List[SyncZMQClient]
+        killer_context = zmq.Context.shadow(self.context.underlying)
+        if self.inproc_server is not None:
+            self._killer_clients.append(SyncZMQClient(server_instance_name=instance_name, 
+                                    identity=f'{self.instance_name}-inproc-killer', client_type=PROXY, handshake=False,
+                                    protocol=ZMQ_PROTOCOLS.INPROC, context=killer_context, logger=self.logger))
+        if self.ipc_server is not None:
+            self._killer_clients.append(SyncZMQClient(server_instance_name=instance_name, 
+                                    identity=f'{self.instance_name}-ipc-killer', client_type=PROXY, handshake=False,
+                                    protocol=ZMQ_PROTOCOLS.IPC, context=killer_context, logger=self.logger))
+        if self.tcp_server is not None:
+            socket_address = self.tcp_server.socket_address
+            if '/*:' in socket_address:
+                socket_address = socket_address.replace('*', 'localhost')
+            self._killer_clients.append(SyncZMQClient(server_instance_name=instance_name, 
+                                    identity=f'{self.instance_name}-tcp-killer', client_type=PROXY, handshake=False,
+                                    protocol=ZMQ_PROTOCOLS.TCP, context=killer_context, logger=self.logger, 
+                                    socket_address=socket_address))
+        # every handshake reply to a client type carries the same serialized empty dictionary
+        self._handshake_payloads = {client_type : serializer.dumps(EMPTY_DICT) 
+                                    for client_type, serializer in self._serializers.items()} # type: typing.Dict[bytes, bytes]
+        self._tunneler_loop = None # type: typing.Optional[asyncio.AbstractEventLoop]
+        self._instructions = asyncio.Queue() # type: asyncio.Queue[typing.Optional[typing.Tuple[typing.List[bytes], typing.Optional[asyncio.TimerHandle], zmq.Socket]]]
+        self._timed_out_instructions = set() # type: typing.Set[bytes] # message IDs already replied with TIMEOUT
         
 
     async def handshake_complete(self):
@@ -988,34 +1129,30 @@ class RPCServer(BaseZMQServer):
         asyncio event loop
         """
         eventloop = asyncio.get_event_loop()
-        eventloop.call_soon(lambda : asyncio.create_task(self.poll()))
-        eventloop.call_soon(lambda : asyncio.create_task(self.tunnel_message_to_things()))
+        eventloop.create_task(self.poll())
+        eventloop.create_task(self.tunnel_message_to_things())
 
 
     @property
     def poll_timeout(self) -> int:
         """
-        socket polling timeout in milliseconds greater than 0. 
+        socket polling timeout in milliseconds, 0 or greater. 
         """
         return self._poll_timeout
 
     @poll_timeout.setter
     def poll_timeout(self, value) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError(("polling period must be an integer greater than 0, not {}.",
-                              "Value is considered in milliseconds.".format(value)))
-        self._poll_timeout = value 
+        self._poll_timeout = _validate_poll_timeout(value)
 
     
     def _get_timeout_from_instruction(self, message : typing.Tuple[bytes]) -> float:
         """
         Unlike ``parse_client_message()``, this method only retrieves the timeout parameter
         """
-        client_type = message[CM_INDEX_CLIENT_TYPE]
-        if client_type == PROXY:
-            return self.zmq_serializer.loads(message[CM_INDEX_TIMEOUT]) 
-        elif client_type == HTTP_SERVER:
-            return self.http_serializer.loads(message[CM_INDEX_TIMEOUT])
+        timeout = message[CM_INDEX_TIMEOUT]
+        if timeout == _NO_TIMEOUT_BYTES:
+            return None
+        return _timeout_decoder.decode(timeout)
        
 
     async def poll(self):
@@ -1024,15 +1161,10 @@ class RPCServer(BaseZMQServer):
         server using an inner inproc client. Registers the messages for timeout calculation.
         """
         self.stop_poll = False
-        eventloop = asyncio.get_event_loop()
         self.inner_inproc_client.handshake()
         await self.inner_inproc_client.handshake_complete()
-        if self.inproc_server:
-            eventloop.call_soon(lambda : asyncio.create_task(self.recv_instruction(self.inproc_server)))
-        if self.ipc_server:
-            eventloop.call_soon(lambda : asyncio.create_task(self.recv_instruction(self.ipc_server)))
-        if self.tcp_server:
-            eventloop.call_soon(lambda : asyncio.create_task(self.recv_instruction(self.tcp_server)))
+        for server in self._servers:
+            asyncio.create_task(self.recv_instruction(server))
        
 
     def stop_polling(self):
@@ -1040,70 +1172,53 @@ class RPCServer(BaseZMQServer):
         stop polling method ``poll()``
         """
         self.stop_poll = True
-        self._instructions_event.set()
-        if self.inproc_server is not None:
-            def kill_inproc_server(instance_name, context, logger):
-                # this function does not work when written fully async - reason is unknown
-                try: 
-                    event_loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    event_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(event_loop)
-                temp_inproc_client = AsyncZMQClient(server_instance_name=instance_name,
-                                            identity=f'{self.instance_name}-inproc-killer',
-                                            context=context, client_type=PROXY, protocol=ZMQ_PROTOCOLS.INPROC, 
-                                            logger=logger) 
-                event_loop.run_until_complete(temp_inproc_client.handshake_complete())
-                event_loop.run_until_complete(temp_inproc_client.socket.send_multipart(temp_inproc_client.craft_empty_message_with_type(EXIT)))
-                temp_inproc_client.exit()
-            threading.Thread(target=kill_inproc_server, args=(self.instance_name, self.context, self.logger), daemon=True).start()
-        if self.ipc_server is not None:
-            temp_client = SyncZMQClient(server_instance_name=self.instance_name, identity=f'{self.instance_name}-ipc-killer',
-                                    client_type=PROXY, protocol=ZMQ_PROTOCOLS.IPC, logger=self.logger) 
-            temp_client.socket.send_multipart(temp_client.craft_empty_message_with_type(EXIT))
-            temp_client.exit()
-        if self.tcp_server is not None:
-            socket_address = self.tcp_server.socket_address
-            if '/*:' in self.tcp_server.socket_address:
-                socket_address = self.tcp_server.socket_address.replace('*', 'localhost')
-            # print("TCP socket address", self.tcp_server.socket_address)
-            temp_client = SyncZMQClient(server_instance_name=self.instance_name, identity=f'{self.instance_name}-tcp-killer',
-                                    client_type=PROXY, protocol=ZMQ_PROTOCOLS.TCP, logger=self.logger,
-                                    socket_address=socket_address)
-            temp_client.socket.send_multipart(temp_client.craft_empty_message_with_type(EXIT))
-            temp_client.exit()   
+        # wake up the tunneler if idle, it forwards the reply in progress and then stops the external servers. 
+        # stop_polling() is usually called by a thing from its executor thread, so the wake-up has to be thread-safe.
+        if self._tunneler_loop is not None and not self._tunneler_loop.is_closed():
+            self._tunneler_loop.call_soon_threadsafe(self._instructions.put_nowait, None)
 
 
     async def recv_instruction(self, server : AsyncZMQServer):
-        eventloop = asyncio.get_event_loop()
         socket = server.socket
-        while True:
-            try:
-                original_instruction = await socket.recv_multipart()
-                if original_instruction[CM_INDEX_MESSAGE_TYPE] == HANDSHAKE:
-                    handshake_task = asyncio.create_task(self._handshake(original_instruction, socket))
-                    eventloop.call_soon(lambda : handshake_task)
-                    continue
-                if original_instruction[CM_INDEX_MESSAGE_TYPE] == EXIT:
+        sync_socket = server._sync_socket
+        # methods called for every received message are bound once
+        recv_multipart = socket.recv_multipart
+        recv_multipart_nowait = sync_socket.recv_multipart
+        put_instruction = self._instructions.put_nowait
+        call_later = asyncio.get_running_loop().call_later
+        get_timeout = self._get_timeout_from_instruction
+        reply_timeout = self._reply_timeout
+        exited = False
+        while not exited:
+            original_instructions = [await recv_multipart()]
+            while True:
+                # drain whatever else is already queued so that the tunneler is woken up once per batch
+                try:
+                    original_instructions.append(recv_multipart_nowait(zmq.NOBLOCK))
+                except zmq.Again:
                     break
-                timeout = self._get_timeout_from_instruction(original_instruction)
-                ready_to_process_event = None
-                timeout_task = None
-                if timeout is not None:
-                    ready_to_process_event = asyncio.Event()
-                    timeout_task = asyncio.create_task(self.process_timeouts(original_instruction, 
-                                                ready_to_process_event, timeout, socket))
-                    eventloop.call_soon(lambda : timeout_task)
-            except Exception as ex:
-                # handle invalid message
-                self.logger.error(f"exception occurred for message id {original_instruction[CM_INDEX_MESSAGE_ID]} - {str(ex)}")
-                invalid_message_task = asyncio.create_task(self._handle_invalid_message(original_instruction,
-                                                                                ex, socket))
-                eventloop.call_soon(lambda: invalid_message_task)
-            else:
-                self._instructions.append((original_instruction, ready_to_process_event, 
-                                                            timeout_task, socket))
-            self._instructions_event.set()
+            for original_instruction in original_instructions:
+                try:
+                    message_type = original_instruction[CM_INDEX_MESSAGE_TYPE]
+                    if message_type == HANDSHAKE:
+                        asyncio.create_task(self._handshake(original_instruction, socket))
+                        continue
+                    if message_type == EXIT:
+                        # wakes up the tunneler from within the loop so that it can see stop_poll
+                        put_instruction(None) 
+                        exited = True
+                        break
+                    timeout = get_timeout(original_instruction)
+                    timeout_handle = None
+                    if timeout is not None:
+                        # a plain loop timer, cancelled by the tunneler once the instruction is due for execution
+                        timeout_handle = call_later(timeout, reply_timeout, original_instruction, sync_socket)
+                except Exception as ex:
+                    # handle invalid message
+                    self.logger.error(f"exception occurred for message id {original_instruction[CM_INDEX_MESSAGE_ID]} - {str(ex)}")
+                    asyncio.create_task(self._handle_invalid_message(original_instruction, ex, socket))
+                else:
+                    put_instruction((original_instruction, timeout_handle, socket))
         self.logger.info(f"stopped polling for server '{server.identity}' {server.socket_address[0:3].upper() if server.socket_address[0:3] in ['ipc', 'tcp'] else 'INPROC'}")
            
 
@@ -1111,58 +1226,81 @@ class RPCServer(BaseZMQServer):
         """
         message tunneler between external sockets and interal inproc client
         """
+        self._tunneler_loop = asyncio.get_running_loop()
+        # attributes and methods chased on every tunneled message are bound once
+        get_instruction = self._instructions.get
+        timed_out_instructions = self._timed_out_instructions
+        inner_send_multipart = self.inner_inproc_client.socket.send_multipart
+        inner_recv_multipart = self.inner_inproc_client.socket.recv_multipart
+        inner_server_address = self.inner_inproc_client.server_address
         while not self.stop_poll:
-            if len(self._instructions) > 0:
-                message, ready_to_process_event, timeout_task, origin_socket = self._instructions.popleft()
-                timeout = True 
-                if ready_to_process_event is not None: 
-                    ready_to_process_event.set()
-                    timeout = await timeout_task
-                if ready_to_process_event is None or not timeout:
-                    original_address = message[CM_INDEX_ADDRESS]
-                    message[CM_INDEX_ADDRESS] = self.inner_inproc_client.server_address # replace address
-                    await self.inner_inproc_client.socket.send_multipart(message)
-                    reply = await self.inner_inproc_client.socket.recv_multipart()
-                    reply[SM_INDEX_ADDRESS] = original_address
-                    if reply[SM_INDEX_MESSAGE_TYPE] != ONEWAY:
-                        await origin_socket.send_multipart(reply)
-            else:
-                await self._instructions_event.wait()
-                self._instructions_event.clear()
+            instruction = await get_instruction()
+            if instruction is None:
+                continue # woken up by stop_polling() or a server that received EXIT, loop condition decides
+            message, timeout_handle, origin_socket = instruction
+            if timeout_handle is not None: 
+                timeout_handle.cancel()
+                if message[CM_INDEX_MESSAGE_ID] in timed_out_instructions:
+                    timed_out_instructions.remove(message[CM_INDEX_MESSAGE_ID])
+                    continue # client was already told the instruction timed out, do not execute
+            original_address = message[CM_INDEX_ADDRESS]
+            message[CM_INDEX_ADDRESS] = inner_server_address # replace address
+            # frames are forwarded as received, so zero-copy sends let large payloads pass both hops without a copy
+            await inner_send_multipart(message, copy=False)
+            reply = await inner_recv_multipart()
+            reply[SM_INDEX_ADDRESS] = original_address
+            if reply[SM_INDEX_MESSAGE_TYPE] != ONEWAY:
+                await origin_socket.send_multipart(reply, copy=False)
+        # instructions left in the queue are never executed, so their timeout timers must not fire after the server 
+        # stopped, when the sockets may be closed already
+        while True:
+            try:
+                instruction = self._instructions.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if instruction is not None and instruction[1] is not None:
+                instruction[1].cancel()
+        timed_out_instructions.clear()
+        for killer_client in self._killer_clients:
+            killer_client.socket.send_multipart(killer_client.craft_empty_message_with_type(EXIT))
         self.logger.info("stopped tunneling messages to things")
 
-    async def process_timeouts(self, original_client_message : typing.List, ready_to_process_event : asyncio.Event,
-                               timeout : typing.Optional[float], origin_socket : zmq.Socket) -> bool:
+    def _reply_timeout(self, original_client_message : typing.List[bytes], origin_socket : zmq.Socket) -> None:
         """
-        replies timeout to client if timeout occured and prevents the instruction from being executed. 
+        replies timeout to client and marks the instruction so that it is not executed. Called by the event loop 
+        when the instruction was not scheduled for execution within its timeout. 
         """
-        try:
-            await asyncio.wait_for(ready_to_process_event.wait(), timeout)
-            return False 
-        except TimeoutError:    
-            await origin_socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
-                original_client_message[CM_INDEX_CLIENT_TYPE], TIMEOUT, original_client_message[CM_INDEX_MESSAGE_ID]))
-            return True
+        self._timed_out_instructions.add(original_client_message[CM_INDEX_MESSAGE_ID])
+        origin_socket.send_multipart(self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
+                original_client_message[CM_INDEX_CLIENT_TYPE], TIMEOUT, original_client_message[CM_INDEX_MESSAGE_ID]), copy=False)
 
     async def _handle_invalid_message(self, original_client_message: builtins.list[builtins.bytes], 
                                 exception: builtins.Exception, originating_socket : zmq.Socket) -> None:
         await originating_socket.send_multipart(self.craft_reply_from_arguments(
                             original_client_message[CM_INDEX_ADDRESS], original_client_message[CM_INDEX_CLIENT_TYPE], 
-                            INVALID_MESSAGE, original_client_message[CM_INDEX_MESSAGE_ID], exception))
+                            INVALID_MESSAGE, original_client_message[CM_INDEX_MESSAGE_ID], 
+                            dict(exception=format_exception_as_json(exception))), copy=False)
         self.logger.info(f"sent exception message to client '{original_client_message[CM_INDEX_ADDRESS]}'." +
                             f" exception - {str(exception)}") 	
     
     async def _handshake(self, original_client_message: builtins.list[builtins.bytes],
                                     originating_socket : zmq.Socket) -> None:
-        await originating_socket.send_multipart(self.craft_reply_from_arguments(
-                original_client_message[CM_INDEX_ADDRESS], 
-                original_client_message[CM_INDEX_CLIENT_TYPE], HANDSHAKE, original_client_message[CM_INDEX_MESSAGE_ID],
-                EMPTY_DICT))
+        payload = self._handshake_payloads.get(original_client_message[CM_INDEX_CLIENT_TYPE], None)
+        if payload is not None:
+            reply = [original_client_message[CM_INDEX_ADDRESS], EMPTY_BYTE, self.server_type, HANDSHAKE, 
+                    original_client_message[CM_INDEX_MESSAGE_ID], payload, EMPTY_BYTE]
+        else:
+            reply = self.craft_reply_from_arguments(original_client_message[CM_INDEX_ADDRESS], 
+                    original_client_message[CM_INDEX_CLIENT_TYPE], HANDSHAKE, original_client_message[CM_INDEX_MESSAGE_ID],
+                    EMPTY_DICT)
+        await originating_socket.send_multipart(reply, copy=False)
         self.logger.info("sent handshake to client '{}'".format(original_client_message[CM_INDEX_ADDRESS]))
 
 
     def exit(self):
         self.stop_poll = True
+        for killer_client in self._killer_clients:
+            killer_client.exit() # sockets on a shared context must be closed before the context is terminated
         for socket in list(self.poller._map.keys()): # iterating over keys will cause dictionary size change during iteration
             try:
                 self.poller.unregister(socket)
@@ -1222,6 +1360,14 @@ class BaseZMQClient(BaseZMQ):
                                                             zmq_serializer=zmq_serializer,
                                                             http_serializer=http_serializer
                                                         )
+        # client type does not change, so the serializer is resolved once instead of on every message 
+        # (None for tunnelers which pass the messages as they are)
+        if self.client_type == HTTP_SERVER:
+            self._serializer = self.http_serializer # type: typing.Optional[BaseSerializer]
+        elif self.client_type == PROXY:
+            self._serializer = self.zmq_serializer
+        else:
+            self._serializer = None    
         if isinstance(server_type, bytes):
             self.server_type = server_type 
         elif isinstance(server_type, Enum):
@@ -1287,20 +1433,17 @@ class BaseZMQClient(BaseZMQ):
                 raise RuntimeError(f'message received from monitor socket cannot be deserialized for {self.instance_name}') from None
         message_type = message[SM_INDEX_MESSAGE_TYPE]
         if message_type == REPLY:
-            if deserialize:
-                if self.client_type == HTTP_SERVER:
-                    message[SM_INDEX_DATA] = self.http_serializer.loads(message[SM_INDEX_DATA]) # type: ignore
-                elif self.client_type == PROXY:
-                    message[SM_INDEX_DATA] = self.zmq_serializer.loads(message[SM_INDEX_DATA]) # type: ignore
+            if deserialize and self._serializer is not None:
+                data = message[SM_INDEX_DATA]
+                # data is left empty by the server when the whole reply is pre-encoded
+                message[SM_INDEX_DATA] = self._serializer.loads(data) if data else None # type: ignore
             return message 
         elif message_type == HANDSHAKE:
             self.logger.debug("""handshake messages arriving out of order are silently dropped as receiving this message 
                 means handshake was successful before. Received hanshake from {}""".format(message[0]))
         elif message_type == EXCEPTION or message_type == INVALID_MESSAGE:
-            if self.client_type == HTTP_SERVER:
-                message[SM_INDEX_DATA] = self.http_serializer.loads(message[SM_INDEX_DATA]) # type: ignore
-            elif self.client_type == PROXY:
-                message[SM_INDEX_DATA] = self.zmq_serializer.loads(message[SM_INDEX_DATA]) # type: ignore
+            if self._serializer is not None:
+                message[SM_INDEX_DATA] = self._serializer.loads(message[SM_INDEX_DATA]) # type: ignore
             if not raise_client_side_exception:
                 return message
             if message[SM_INDEX_DATA].get('exception', None) is not None:
@@ -1324,26 +1467,23 @@ class BaseZMQClient(BaseZMQ):
         message from client to server:
 
         ::
-            [address, bytes(), client type, message type, message id, instruction, arguments]
-            [ 0     ,   1    ,     2      ,      3      ,       4   ,    5       ,     6    ]
+            [address, bytes(), client type, message type, message id, 
+            [ 0     ,   1    ,     2      ,      3      ,       4   , 
+            
+            timeout, instruction, arguments, execution context] 
+               5   ,      6     ,     7    ,       8          ]
 
         """
-        message_id = bytes(str(uuid4()), encoding='utf-8')
-        if self.client_type == HTTP_SERVER:
-            timeout = self.http_serializer.dumps(timeout) # type: bytes
-            instruction = self.http_serializer.dumps(instruction) # type: bytes
-            # TODO - following can be improved
-            if arguments == b'':
-                arguments = self.http_serializer.dumps({}) # type: bytes
-            elif not isinstance(arguments, byte_types):
-                arguments = self.http_serializer.dumps(arguments) # type: bytes
-            context = self.http_serializer.dumps(context) # type: bytes
-        elif self.client_type == PROXY:
-            timeout = self.zmq_serializer.dumps(timeout) # type: bytes
-            instruction = self.zmq_serializer.dumps(instruction) # type: bytes
+        message_id = _new_message_id() # opaque random bytes, uuid formatting is unnecessary
+        timeout = _NO_TIMEOUT_BYTES if timeout is None else _context_encoder.encode(timeout) # type: bytes
+        context = _EMPTY_DICT_BYTES if context is EMPTY_DICT else _context_encoder.encode(context) # type: bytes
+        serializer = self._serializer
+        if serializer is not None:
+            instruction = serializer.dumps(instruction) # type: bytes
             if not isinstance(arguments, byte_types):
-                arguments = self.zmq_serializer.dumps(arguments) # type: bytes
-            context = self.zmq_serializer.dumps(context)
+                arguments = serializer.dumps(arguments) # type: bytes
+            elif arguments == EMPTY_BYTE:
+                arguments = serializer.dumps(EMPTY_DICT) # type: bytes
               
         return [
             self.server_address, 
@@ -1362,17 +1502,7 @@ class BaseZMQClient(BaseZMQ):
         """
         create handshake message for example
         """
-        return [
-            self.server_address,
-            EMPTY_BYTE,
-            self.client_type,
-            message_type,
-            EMPTY_BYTE,
-            EMPTY_BYTE,
-            EMPTY_BYTE,
-            EMPTY_BYTE,
-            EMPTY_BYTE
-        ]
+        return [self.server_address, EMPTY_BYTE, self.client_type, message_type, *_EMPTY_MESSAGE_TAIL]
     
     def exit(self) -> None:
         BaseZMQ.exit(self)
@@ -1485,8 +1615,10 @@ class SyncZMQClient(BaseZMQClient, BaseSyncZMQ):
             a byte representation of message id
         """
         message = self.craft_instruction_from_arguments(instruction, arguments, invokation_timeout, context)
-        self.socket.send_multipart(message)
-        self.logger.debug(f"sent instruction '{instruction}' to server '{self.instance_name}' with msg-id '{message[SM_INDEX_MESSAGE_ID]}'")
+        # frames larger than zmq.COPY_THRESHOLD (large arguments) are handed over to zmq without copying, 
+        # smaller ones are anyway copied by pyzmq
+        self.socket.send_multipart(message, copy=False)
+        self.logger.debug("sent instruction '%s' to server '%s' with msg-id '%s'", instruction, self.instance_name, message[SM_INDEX_MESSAGE_ID])
         return message[SM_INDEX_MESSAGE_ID]
     
     def recv_reply(self, message_id : bytes, timeout : typing.Optional[int] = None, raise_client_side_exception : bool = False, 
@@ -1515,7 +1647,7 @@ class SyncZMQClient(BaseZMQClient, BaseSyncZMQ):
                 if message_id != reply[SM_INDEX_MESSAGE_ID]:
                     self._reply_cache[message_id] = reply
                     continue 
-                self.logger.debug("received reply with msg-id {}".format(reply[SM_INDEX_MESSAGE_ID]))
+                self.logger.debug("received reply with msg-id %s", reply[SM_INDEX_MESSAGE_ID])
                 return reply
             if timeout is not None:
                 break # this should not break, technically an error, should be fixed when inventing better RPC contract
@@ -1687,8 +1819,8 @@ class AsyncZMQClient(BaseZMQClient, BaseAsyncZMQ):
             a byte representation of message id
         """
         message = self.craft_instruction_from_arguments(instruction, arguments, invokation_timeout, context) 
-        await self.socket.send_multipart(message)
-        self.logger.debug(f"sent instruction '{instruction}' to server '{self.instance_name}' with msg-id {message[SM_INDEX_MESSAGE_ID]}")
+        await self.socket.send_multipart(message, copy=False) # see SyncZMQClient.send_instruction 
+        self.logger.debug("sent instruction '%s' to server '%s' with msg-id %s", instruction, self.instance_name, message[SM_INDEX_MESSAGE_ID])
         return message[SM_INDEX_MESSAGE_ID]
     
     async def async_recv_reply(self, message_id : bytes, timeout : typing.Optional[int] = None, 
@@ -1718,7 +1850,7 @@ class AsyncZMQClient(BaseZMQClient, BaseAsyncZMQ):
                 if message_id != reply[SM_INDEX_MESSAGE_ID]:
                     self._reply_cache[message_id] = reply
                     continue 
-                self.logger.debug(f"received reply with message-id '{reply[SM_INDEX_MESSAGE_ID]}'")
+                self.logger.debug("received reply with message-id '%s'", reply[SM_INDEX_MESSAGE_ID])
                 return reply
             if timeout is not None:
                 break
@@ -1789,7 +1921,7 @@ class MessageMappedZMQClientPool(BaseZMQClient):
         self.event_pool = AsyncioEventPool(len(server_instance_names))
         self.events_map = dict() # type: typing.Dict[bytes, asyncio.Event]
         self.message_map = dict()
-        self.cancelled_messages = []
+        self.cancelled_messages = set() # type: typing.Set[bytes] # checked for every reply
         self.poll_timeout = poll_timeout
         self.stop_poll = False 
         self._deserialize_server_messages = deserialize_server_messages
@@ -1820,15 +1952,13 @@ class MessageMappedZMQClientPool(BaseZMQClient):
     @property
     def poll_timeout(self) -> int:
         """
-        socket polling timeout in milliseconds greater than 0. 
+        socket polling timeout in milliseconds, 0 or greater. 
         """
         return self._poll_timeout
 
     @poll_timeout.setter
     def poll_timeout(self, value) -> None:
-        if not isinstance(value, int) or value < 0:
-            raise ValueError("polling period must be an integer greater than 0, not {}. Value is considered in milliseconds".format(value))
-        self._poll_timeout = value 
+        self._poll_timeout = _validate_poll_timeout(value)
 
 
     async def poll(self) -> None:
@@ -1838,9 +1968,8 @@ class MessageMappedZMQClientPool(BaseZMQClient):
         """
         self.logger.info("client polling started for sockets for {}".format(list(self.pool.keys())))
         self.stop_poll = False 
-        event_loop = asyncio.get_event_loop()
         while not self.stop_poll:
-            sockets = await self.poller.poll(self.poll_timeout) # type hints dont work in this line
+            sockets = await self.poller.poll(self._poll_timeout) # type hints dont work in this line
             for socket, _ in sockets:
                 while True:
                     try:
@@ -1860,11 +1989,14 @@ class MessageMappedZMQClientPool(BaseZMQClient):
                                     " Unregistering from poller temporarily until server comes back.")
                                 break
                     else:
-                        address, _, server_type, message_type, message_id, data, encoded_data = reply
-                        self.logger.debug(f"received reply from server '{address}' with message ID '{message_id}'")
+                        # only the fields required for mapping the reply are accessed
+                        message_id = reply[SM_INDEX_MESSAGE_ID]
+                        encoded_data = reply[SM_INDEX_ENCODED_DATA]
+                        data = reply[SM_INDEX_DATA]
+                        self.logger.debug("received reply from server '%s' with message ID '%s'", reply[SM_INDEX_ADDRESS], message_id)
                         if message_id in self.cancelled_messages:
                             self.cancelled_messages.remove(message_id)
-                            self.logger.debug(f"message_id '{message_id}' cancelled")
+                            self.logger.debug("message_id '%s' cancelled", message_id)
                             continue
                         event = self.events_map.get(message_id, None) 
                         if event:
@@ -1875,10 +2007,9 @@ class MessageMappedZMQClientPool(BaseZMQClient):
                             event.set()
                         else:    
                             if len(encoded_data) > 0:
-                                invalid_event_task = asyncio.create_task(self._resolve_reply(message_id, encoded_data))
+                                asyncio.create_task(self._resolve_reply(message_id, encoded_data))
                             else:
-                                invalid_event_task = asyncio.create_task(self._resolve_reply(message_id, data))
-                            event_loop.call_soon(lambda: invalid_event_task)
+                                asyncio.create_task(self._resolve_reply(message_id, data))
 
 
     async def _resolve_reply(self, message_id : bytes, data : typing.Any) -> None:
@@ -1902,7 +2033,7 @@ class MessageMappedZMQClientPool(BaseZMQClient):
                 if message_id in self.cancelled_messages:
                     # Only for safety, likely should never reach here
                     self.cancelled_messages.remove(message_id)
-                    self.logger.debug(f'message_id {message_id} cancelled')
+                    self.logger.debug('message_id %s cancelled', message_id)
                     return 
                 if i >= max_number_of_retries - 1:
                     self.logger.error("unknown message id {} without corresponding event object".format(message_id)) 
@@ -1998,8 +2129,8 @@ class MessageMappedZMQClientPool(BaseZMQClient):
             except TimeoutError:
                 if timeout is None:
                     continue
-                self.cancelled_messages.append(message_id)
-                self.logger.debug(f'message_id {message_id} added to list of cancelled messages')
+                self.cancelled_messages.add(message_id)
+                self.logger.debug('message_id %s added to list of cancelled messages', message_id)
                 raise TimeoutError(f"Execution not completed within {timeout} seconds") from None
         self.events_map.pop(message_id)
         self.event_pool.completed(event)
@@ -2048,7 +2179,7 @@ class MessageMappedZMQClientPool(BaseZMQClient):
         register the server message polling loop in the asyncio event loop. 
         """
         event_loop = asyncio.get_event_loop()
-        event_loop.call_soon(lambda: asyncio.create_task(self.poll()))
+        event_loop.create_task(self.poll())
 
     def stop_polling(self):
         """
@@ -2131,7 +2262,8 @@ class MessageMappedZMQClientPool(BaseZMQClient):
 
 class AsyncioEventPool:
     """
-    creates a pool of asyncio Events to be used as a synchronisation object for MessageMappedClientPool
+    creates a pool of asyncio Events to be used as a synchronisation object for MessageMappedClientPool, waiting
+    for the replies of its messages. (Instruction timeouts of the RPCServer are loop timers and do not use it.)
 
     Parameters
     ----------
@@ -2140,7 +2272,7 @@ class AsyncioEventPool:
     """
 
     def __init__(self, initial_number_of_events : int) -> None:
-        self.pool = [asyncio.Event() for i in range(initial_number_of_events)] 
+        self.pool = deque(asyncio.Event() for i in range(initial_number_of_events)) 
         self.size = initial_number_of_events
 
     def pop(self) -> asyncio.Event:
@@ -2148,7 +2280,7 @@ class AsyncioEventPool:
         pop an event, new one is created if nothing left in pool
         """
         try:
-            event = self.pool.pop(0)
+            event = self.pool.popleft()
         except IndexError:
             self.size += 1
             event = asyncio.Event()
@@ -2174,6 +2306,8 @@ class EventPublisher(BaseZMQServer, BaseSyncZMQ):
         self.logger.info(f"created event publishing socket at {self.socket_address}")
         self.events = set() # type: typing.Set[EventDispatcher] 
         self.event_ids = set() # type: typing.Set[bytes]
+        # JSON RPC serializer needs a single event for both HTTP & RPC clients, decided once instead of per event 
+        self._single_event_per_publish = isinstance(self.zmq_serializer, JSONSerializer)
 
     def register(self, event : "EventDispatcher") -> None:
         """
@@ -2225,7 +2359,7 @@ class EventPublisher(BaseZMQServer, BaseSyncZMQ):
         """
         if unique_identifier in self.event_ids:
             if serialize:
-                if isinstance(self.zmq_serializer , JSONSerializer):
+                if self._single_event_per_publish:
                     self.socket.send_multipart([unique_identifier, self.http_serializer.dumps(data)])
                     return
                 if zmq_clients:
@@ -2233,7 +2367,7 @@ class EventPublisher(BaseZMQServer, BaseSyncZMQ):
                     self.socket.send_multipart([b'zmq-' + unique_identifier, self.zmq_serializer.dumps(data)])
                 if http_clients:
                     self.socket.send_multipart([unique_identifier, self.http_serializer.dumps(data)])
-            elif not isinstance(self.zmq_serializer , JSONSerializer):
+            elif not self._single_event_per_publish:
                 if zmq_clients:
                     self.socket.send_multipart([b'zmq-' + unique_identifier, data])
                 if http_clients:
@@ -2394,24 +2528,17 @@ class AsyncEventConsumer(BaseEventConsumer):
                 pass     
         if not deserialize or not contents: 
             return contents
-        if self.client_type == HTTP_SERVER:
-            return self.http_serializer.loads(contents)
-        elif self.client_type == PROXY:
-            return self.zmq_serializer.loads(contents)
-        else:
+        if self._serializer is None:
             raise ValueError("invalid client type")
+        return self._serializer.loads(contents)
 
     async def interrupt(self):
         """
         interrupts the event consumer and returns a 'INTERRUPT' string from the receive() method, 
         generally should be used for exiting this object
         """
-        if self.client_type == HTTP_SERVER:
-            message = [self.http_serializer.dumps(f'{self.identity}/interrupting-server'), 
-                       self.http_serializer.dumps("INTERRUPT")]
-        elif self.client_type == PROXY:
-            message = [self.zmq_serializer.dumps(f'{self.identity}/interrupting-server'), 
-                       self.zmq_serializer.dumps("INTERRUPT")]
+        message = [self._serializer.dumps(f'{self.identity}/interrupting-server'), 
+                   self._serializer.dumps("INTERRUPT")]
         await self.interrupting_peer.send_multipart(message)
 
     
@@ -2473,24 +2600,17 @@ class EventConsumer(BaseEventConsumer):
                 pass
         if not deserialize: 
             return contents
-        if self.client_type == HTTP_SERVER:
-            return self.http_serializer.loads(contents)
-        elif self.client_type == PROXY:
-            return self.zmq_serializer.loads(contents)
-        else:
+        if self._serializer is None:
             raise ValueError("invalid client type for event")
+        return self._serializer.loads(contents)
         
     def interrupt(self):
         """
         interrupts the event consumer and returns a 'INTERRUPT' string from the receive() method, 
         generally should be used for exiting this object
         """
-        if self.client_type == HTTP_SERVER:
-            message = [self.http_serializer.dumps(f'{self.identity}/interrupting-server'), 
-                       self.http_serializer.dumps("INTERRUPT")]
-        elif self.client_type == PROXY:
-            message = [self.zmq_serializer.dumps(f'{self.identity}/interrupting-server'), 
-                       self.zmq_serializer.dumps("INTERRUPT")]
+        message = [self._serializer.dumps(f'{self.identity}/interrupting-server'), 
+                   self._serializer.dumps("INTERRUPT")]
         self.interrupting_peer.send_multipart(message)
     
         
@@ -0,0 +1,176 @@
+import unittest, logging, asyncio
+import numpy
+import zmq, zmq.asyncio
+from hololinked.server.zmq_message_brokers import (AsyncZMQServer, AsyncPollingZMQServer, SyncZMQClient, RPCServer, 
+                                                ServerTypes, PROXY, INVALID_MESSAGE, REPLY, CM_INDEX_EXECUTION_CONTEXT, 
+                                                CM_INDEX_MESSAGE_ID, SM_INDEX_MESSAGE_TYPE, SM_INDEX_MESSAGE_ID, 
+                                                SM_INDEX_DATA, SM_INDEX_ENCODED_DATA)
+
+try:
+    from .utils import TestCase, TestRunner
+except ImportError:
+    from utils import TestCase, TestRunner
+
+
+
+class TestMessageBrokers(TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        print("test message brokers")
+        self.context = zmq.asyncio.Context()
+        self.server = AsyncZMQServer(instance_name='test-message-brokers', server_type=ServerTypes.THING.value, 
+                                    context=self.context, protocol='INPROC', log_level=logging.WARN)
+        self.client = SyncZMQClient(server_instance_name='test-message-brokers', identity='test-message-brokers-client', 
+                                    client_type=PROXY, handshake=False, protocol='INPROC', log_level=logging.WARN, 
+                                    context=zmq.Context.shadow(self.context.underlying))
+
+    @classmethod
+    def tearDownClass(self):
+        print("tear down test message brokers")
+        self.client.socket.close(0)
+        self.server.socket.close(0)
+        self.context.term()
+
+
+    def test_1_execution_context(self):
+        # execution context values given through HTTP query parameters need not be bool
+        for value, expected in [(True, True), (1, True), ('true', True), ('1', True), (0, False), (False, False)]:
+            message = self.client.craft_instruction_from_arguments('/test-message-brokers/test_echo/invoke-on-POST',
+                                                            context=dict(fetch_execution_logs=value))
+            message = self.server.parse_client_message(message)
+            self.assertIsNotNone(message)
+            self.assertEqual(message[CM_INDEX_EXECUTION_CONTEXT].fetch_execution_logs, expected)
+            self.assertFalse(message[CM_INDEX_EXECUTION_CONTEXT].oneway)
+        # no context means default context
+        message = self.client.craft_instruction_from_arguments('/test-message-brokers/test_echo/invoke-on-POST')
+        message = self.server.parse_client_message(message)
+        self.assertFalse(message[CM_INDEX_EXECUTION_CONTEXT].fetch_execution_logs)
+        # strings that cannot be coerced to bool are not taken as truthy, the client is answered with INVALID_MESSAGE 
+        message = self.client.craft_instruction_from_arguments('/test-message-brokers/test_echo/invoke-on-POST',
+                                                            context=dict(oneway='maybe'))
+        self.client.socket.send_multipart(message)
+
+        async def receive():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(self.server.async_recv_instructions(), 0.5)
+        asyncio.run(receive())
+
+        reply = self.client.recv_reply(message[CM_INDEX_MESSAGE_ID], timeout=1000)
+        self.assertIsNotNone(reply)
+        self.assertEqual(reply[SM_INDEX_MESSAGE_TYPE], INVALID_MESSAGE)
+
+
+    def test_2_invalid_message(self):
+        # a frame that cannot be parsed must be answered with INVALID_MESSAGE instead of leaving the client hanging
+        message = self.client.craft_instruction_from_arguments('/test-message-brokers/test_echo/invoke-on-POST')
+        message[CM_INDEX_EXECUTION_CONTEXT] = b'\xc1' # never used byte in msgpack
+        self.client.socket.send_multipart(message)
+
+        async def receive():
+            # the invalid message is not returned, the receive keeps waiting for valid instructions
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(self.server.async_recv_instructions(), 0.5)
+        asyncio.run(receive())
+       
+        reply = self.client.recv_reply(message[CM_INDEX_MESSAGE_ID], timeout=1000)
+        self.assertIsNotNone(reply)
+        self.assertEqual(reply[SM_INDEX_MESSAGE_TYPE], INVALID_MESSAGE)
+        self.assertIn('exception', reply[SM_INDEX_DATA])
+
+
+    def test_3_poll_timeout(self):
+        server = AsyncPollingZMQServer(instance_name='test-message-brokers-polled', server_type=ServerTypes.THING.value,
+                                    context=self.context, protocol='INPROC', log_level=logging.WARN)
+        try:
+            for value in [0, 25, numpy.int64(100)]:
+                server.poll_timeout = value
+                self.assertEqual(server.poll_timeout, value)
+                self.assertIs(type(server.poll_timeout), int)
+            for value in [-1, 2.5, True, '25', None]:
+                with self.assertRaises(ValueError):
+                    server.poll_timeout = value
+            self.assertEqual(server.poll_timeout, 100) # unchanged by invalid values
+        finally:
+            server.socket.close(0)
+
+
+
+    def test_4_stop_with_queued_timed_instruction(self):
+        # instructions still queued when the RPC server stops are not executed, their timeout timers must not fire
+        # after the stop on sockets that may be closed already
+        context = zmq.asyncio.Context() # terminated by the RPC server on exit
+        rpc_server = RPCServer(instance_name='test-rpc-server-stop', server_type=ServerTypes.THING.value, 
+                            context=context, protocols='INPROC', log_level=logging.WARN)
+        client = SyncZMQClient(server_instance_name='test-rpc-server-stop', identity='test-rpc-server-stop-client', 
+                            client_type=PROXY, handshake=False, protocol='INPROC', log_level=logging.WARN, 
+                            context=zmq.Context.shadow(context.underlying))
+        loop_exceptions = []
+
+        async def thing():
+            # executes the first instruction only after the server was asked to stop
+            while True:
+                instructions = await rpc_server.inner_inproc_server.async_recv_instructions()
+                if instructions:
+                    break
+            rpc_server.stop_polling()
+            await asyncio.sleep(0.1)
+            await rpc_server.inner_inproc_server.async_send_reply(instructions[0], None)
+
+        async def run():
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: loop_exceptions.append(context))
+            thing_task = asyncio.create_task(thing())
+            await rpc_server.poll()
+            tunneler_task = asyncio.create_task(rpc_server.tunnel_message_to_things())
+            await asyncio.sleep(0.1)
+            client.send_instruction('/test-rpc-server-stop/test_echo/invoke-on-POST', dict(value=1))
+            timed_id = client.send_instruction('/test-rpc-server-stop/test_echo/invoke-on-POST', dict(value=2), 
+                                            invokation_timeout=0.5)
+            await asyncio.wait_for(asyncio.gather(thing_task, tunneler_task), 5)
+            await asyncio.sleep(1) # longer than the timeout of the queued instruction
+            return timed_id
+
+        try:
+            timed_id = asyncio.run(run())
+            replies = []
+            while client.socket.poll(100):
+                replies.append(client.socket.recv_multipart())
+            self.assertEqual([reply[SM_INDEX_MESSAGE_TYPE] for reply in replies], [REPLY])
+            self.assertNotIn(timed_id, [reply[SM_INDEX_MESSAGE_ID] for reply in replies])
+            self.assertEqual(len(rpc_server._timed_out_instructions), 0)
+            self.assertEqual(loop_exceptions, [])
+        finally:
+            client.socket.close(0)
+            for socket in [rpc_server.inner_inproc_server.socket, rpc_server.event_publisher.socket]:
+                socket.close(0)
+            rpc_server.inner_inproc_client.exit() # also closes its monitor socket
+            rpc_server.exit()
+
+
+    def test_5_pre_encoded_reply(self):
+        # a reply that is entirely pre-encoded leaves the data frame empty, which the client reads as None, while the 
+        # pre-encoded frame reaches the client untouched
+        message = self.client.craft_instruction_from_arguments('/test-message-brokers/test_echo/invoke-on-POST')
+        self.client.socket.send_multipart(message)
+        pre_encoded_data = b'\x00pre-encoded\xff'
+
+        async def reply():
+            instructions = await asyncio.wait_for(self.server.async_recv_instructions(), 1)
+            self.assertEqual(len(instructions), 1)
+            await self.server.async_send_reply(instructions[0], None, pre_encoded_data=pre_encoded_data)
+        asyncio.run(reply())
+
+        self.assertTrue(self.client.socket.poll(1000))
+        raw_reply = self.client.socket.recv_multipart()
+        self.assertEqual(raw_reply[SM_INDEX_MESSAGE_ID], message[CM_INDEX_MESSAGE_ID])
+        self.assertEqual(raw_reply[SM_INDEX_DATA], b'')
+        self.assertEqual(raw_reply[SM_INDEX_ENCODED_DATA], pre_encoded_data)
+        reply = self.client.parse_server_message(raw_reply)
+        self.assertEqual(reply[SM_INDEX_MESSAGE_TYPE], REPLY)
+        self.assertIsNone(reply[SM_INDEX_DATA])
+        self.assertEqual(reply[SM_INDEX_ENCODED_DATA], pre_encoded_data)
+
+
+
+if __name__ == '__main__':
+    unittest.main(testRunner=TestRunner())
@@ -1,6 +1,7 @@
 import threading, random, asyncio, requests
-import logging, multiprocessing, unittest
+import logging, multiprocessing, unittest, time
 from hololinked.client import ObjectProxy
+from hololinked.server.zmq_message_brokers import SyncZMQClient, PROXY, TIMEOUT, SM_INDEX_MESSAGE_TYPE, SM_INDEX_DATA
 
 try:
     from .utils import TestCase, TestRunner
@@ -108,6 +109,27 @@ class TestRPC(TestCase):
         self.assertEqual(done_queue_8.get(), True)
 
 
+    def test_8_invokation_timeout(self):
+        # an instruction that could not be scheduled for execution within its invokation timeout is answered with 
+        # TIMEOUT and never executed, also not when the thing is free again
+        client = SyncZMQClient(server_instance_name='test-rpc', identity='test-rpc-timeout-client', 
+                            client_type=PROXY, log_level=logging.WARN)
+        sleep_id = client.send_instruction(self.thing_client.sleep_for._instruction, dict(duration=3))
+        start = time.time()
+        count_id = client.send_instruction(self.thing_client.count_call._instruction, invokation_timeout=0.3)
+        reply = client.recv_reply(count_id)
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(reply[SM_INDEX_MESSAGE_TYPE], TIMEOUT)
+        reply = client.recv_reply(sleep_id)
+        self.assertIsNone(reply[SM_INDEX_DATA])
+        # the timed out instruction does not send a late reply
+        self.assertIsNone(client.recv_reply(count_id, timeout=500))
+        self.assertNotIn(count_id, client._reply_cache)
+        # and was never executed, the first call that is not timed out is the first execution
+        self.assertEqual(self.thing_client.count_call(), 1)
+        client.exit()
+
+
 
 def start_client(done_queue : multiprocessing.Queue, typ : str = 'normal', tcp_socket_address : str = None):
     if typ == 'normal':
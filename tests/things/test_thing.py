@@ -1,3 +1,4 @@
+import time
 from hololinked.server import Thing, action
 
 
@@ -16,4 +17,14 @@ class TestThing(Thing):
 
     @action()
     def test_echo(self, value):
-        return value
\ No newline at end of file
+        return value
+    
+    @action()
+    def sleep_for(self, duration):
+        time.sleep(duration)
+
+    @action()
+    def count_call(self):
+        # returns how often it was executed, to check that an instruction was not executed
+        self._call_count = getattr(self, '_call_count', 0) + 1
+        return self._call_count
\ No newline at end of file